@@ -0,0 +1,249 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import tempfile
+import time
+import tracemalloc
+import matplotlib
+import matplotlib.backends.backend_agg
+import matplotlib.figure
+import matplotlib.ticker
+import numpy as np
+import scipy
+import scipy.special
+import scipy.stats
+import dataAnalysis
+from delayData import flattenActivities, streamDelayColumns
+from delayStats import StreamingDelayStats
+
+
+# Benchmarks of the delay analysis pipeline on synthetic delay exports. Every stage of `run` is timed separately, and
+# run a second time under tracemalloc for its peak memory, since tracing slows down allocation-heavy stages like JSON
+# parsing. Exports above `dataAnalysis.streamingFileSize` go through the streaming stages of `runStreaming` instead.
+# The modules that dataAnalysis imports on first use are imported up front, so the first export does not time them.
+
+
+### Synthetic exports
+
+# Activity descriptions with their share of the activities in the thesis export
+syntheticDescriptions = {
+    'Drive train': 0.56,
+    'Locomotive movement': 0.11,
+    'Wagon technical inspection': 0.10,
+    'Shunting': 0.07,
+    'Travel Time by Car to/from destination': 0.06,
+    'Locomotive Exchange': 0.02,
+    'Brake test': 0.08,
+}
+syntheticLocationCodes = ['Mvtww', 'Kfhz', 'HBTH', 'Kfhn', 'EEM', 'Mvtw', 'Mvtaho', 'Amf', 'EDRH', 'Ut', 'Rtd', 'Asd']
+syntheticActivitiesPerDuty = 4
+syntheticBatchSize = 100000
+
+# Activities of a synthetic export, with the per-activity fields and delay lists of DebugDelaysExporter. Every delay
+# list is sorted separately, like the exporter does.
+def generateActivities(activityCount, firstActivityIndex, random, maxDelayCount=None):
+    occurrenceCounts = np.minimum(random.zipf(2.3, activityCount), 500)
+    if maxDelayCount != None:
+        cumulativeCounts = np.cumsum(occurrenceCounts)
+        activityCount = min(int(np.searchsorted(cumulativeCounts, maxDelayCount)) + 1, activityCount)
+        occurrenceCounts = occurrenceCounts[:activityCount]
+        occurrenceCounts[-1] -= max(int(occurrenceCounts.sum()) - maxDelayCount, 0)
+
+    descriptions = random.choice(list(syntheticDescriptions), activityCount, p=np.array(list(syntheticDescriptions.values())) / sum(syntheticDescriptions.values()))
+    locationIndices = random.integers(0, len(syntheticLocationCodes), (activityCount, 2))
+    plannedDurations = 30 * np.minimum(random.geometric(0.3, activityCount) - 1, 48)
+
+    delayCount = int(occurrenceCounts.sum())
+    startDelays = np.round(random.normal(5, 25, delayCount)).astype(np.int64)
+    isPositive = random.random(delayCount) < 0.35
+    durationDelays = np.where(isPositive, np.ceil(random.gamma(0.9, 60, delayCount)), -np.round(random.exponential(10, delayCount))).astype(np.int64)
+    endDelays = startDelays + durationDelays
+
+    delayActivityIndices = np.repeat(np.arange(activityCount), occurrenceCounts)
+    splitIndices = np.cumsum(occurrenceCounts)[:-1]
+    delayLists = [np.split(delays[np.lexsort((delays, delayActivityIndices))], splitIndices) for delays in [startDelays, endDelays, durationDelays]]
+
+    activities = []
+    for activityIndex in range(activityCount):
+        activities.append({
+            'name': '\tRLX %07d' % ((firstActivityIndex + activityIndex) // syntheticActivitiesPerDuty),
+            'description': str(descriptions[activityIndex]),
+            'startLocationCode': syntheticLocationCodes[locationIndices[activityIndex, 0]],
+            'endLocationCode': syntheticLocationCodes[locationIndices[activityIndex, 1]],
+            'plannedDuration': int(plannedDurations[activityIndex]),
+            'occurrenceCount': int(occurrenceCounts[activityIndex]),
+            'startDelays': delayLists[0][activityIndex].tolist(),
+            'endDelays': delayLists[1][activityIndex].tolist(),
+            'durationDelays': delayLists[2][activityIndex].tolist(),
+        })
+    return activities
+
+
+# Write a synthetic export with exactly `delayCount` delays, formatted like the JSON that Newtonsoft writes for the
+# exporter, in batches so that exports of 10^8 delays do not have to fit in memory
+def generateDelayExport(filePath, delayCount, seed=0):
+    random = np.random.default_rng(seed)
+    writtenDelayCount = 0
+    activityCount = 0
+    with open(filePath, 'w', encoding='utf-8', newline='\n') as writeFile:
+        writeFile.write('{\n  "activities": [')
+        while writtenDelayCount < delayCount:
+            activities = generateActivities(syntheticBatchSize, activityCount, random, delayCount - writtenDelayCount)
+            for activity in activities:
+                activityStr = json.dumps(activity, indent=2, ensure_ascii=False).replace('\n', '\n    ')
+                writeFile.write('\n    ' + activityStr if activityCount == 0 else ',\n    ' + activityStr)
+                activityCount += 1
+            writtenDelayCount += sum(activity['occurrenceCount'] for activity in activities)
+        writeFile.write('\n  ]\n}' if activityCount > 0 else ']\n}')
+    return activityCount
+
+
+### Stages
+
+# Time each stage, or trace the peak memory of each stage
+class StageTimer:
+    def __init__(self):
+        self.results = {}
+
+    def run(self, stageName, function, *args):
+        startTime = time.perf_counter()
+        result = function(*args)
+        self.results[stageName] = time.perf_counter() - startTime
+        return result
+
+class StageMemoryTracer:
+    def __init__(self):
+        self.results = {}
+
+    def run(self, stageName, function, *args):
+        tracemalloc.start()
+        try:
+            result = function(*args)
+            self.results[stageName] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        return result
+
+
+def loadJson(filePath):
+    with open(filePath, 'r', encoding='utf-8') as readFile:
+        return json.load(readFile)
+
+def streamDelayStats(filePath):
+    delayStats = StreamingDelayStats()
+    for columns in streamDelayColumns(filePath):
+        delayStats.add(columns)
+    return delayStats
+
+# The fit stage includes the R^2 of the gamma fit, as in the text output of `run`
+def fitDelayData(data, summary):
+    dataAnalysis.fitDelayModel(data, summary)
+    dataAnalysis.getGammaFitRSquared(data['gammaAlpha'], data['gammaScale'], data['allPositiveDelays'])
+
+# Run the stages of `run` on an export, with the figures rendered into a fresh folder in a single process
+def runPipelineStages(filePath, recorder, streaming, durationIndexSize=30):
+    plotsFolder = tempfile.mkdtemp(prefix='plots-')
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            if streaming:
+                delayStats = recorder.run('stream', streamDelayStats, filePath)
+                data, summary = recorder.run('bucket', dataAnalysis.getStreamedDelayData, delayStats, durationIndexSize)
+            else:
+                activities = recorder.run('parse', loadJson, filePath)['activities']
+                columns = recorder.run('flatten', flattenActivities, activities)
+                del activities
+                data, summary = recorder.run('bucket', dataAnalysis.getDelayData, columns, durationIndexSize)
+            recorder.run('fit', fitDelayData, data, summary)
+            recorder.run('render', dataAnalysis.renderFigures, summary['delayFigures'], data, None, plotsFolder, 1, True)
+    finally:
+        shutil.rmtree(plotsFolder, ignore_errors=True)
+    return recorder.results
+
+
+### Benchmarks
+
+def getEnvironmentInfo():
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'scipy': scipy.__version__,
+        'matplotlib': matplotlib.__version__,
+        'platform': platform.platform(),
+        'cpuCount': os.cpu_count(),
+    }
+
+
+# Benchmark the pipeline for each export size; exports are generated into `dataFolder`, or a temporary folder
+def runBenchmarks(delayCounts, dataFolder=None, measureMemory=True, seed=0):
+    isTempFolder = dataFolder == None
+    if isTempFolder: dataFolder = tempfile.mkdtemp(prefix='delays-')
+    os.makedirs(dataFolder, exist_ok=True)
+    results = []
+    try:
+        for delayCount in delayCounts:
+            filePath = os.path.join(dataFolder, 'delays-%d.json' % delayCount)
+            startTime = time.perf_counter()
+            activityCount = generateDelayExport(filePath, delayCount, seed)
+            generateTime = time.perf_counter() - startTime
+            fileSize = os.path.getsize(filePath)
+            streaming = fileSize > dataAnalysis.streamingFileSize
+
+            stageTimes = runPipelineStages(filePath, StageTimer(), streaming)
+            stagePeakBytes = runPipelineStages(filePath, StageMemoryTracer(), streaming) if measureMemory else {}
+            results.append({
+                'delayCount': delayCount,
+                'activityCount': activityCount,
+                'fileSize': fileSize,
+                'streaming': streaming,
+                'generateTime': generateTime,
+                'stageTimes': stageTimes,
+                'stagePeakBytes': stagePeakBytes,
+            })
+            printBenchmarkResult(results[-1])
+            if isTempFolder: os.remove(filePath)
+    finally:
+        if isTempFolder: shutil.rmtree(dataFolder, ignore_errors=True)
+    return {'environment': getEnvironmentInfo(), 'results': results}
+
+
+def printBenchmarkResult(result):
+    print('%d delays (%d activities, %.1f MB%s):' % (result['delayCount'], result['activityCount'], result['fileSize'] / 1e6, ', streaming' if result['streaming'] else ''))
+    for stageName, stageTime in result['stageTimes'].items():
+        peakBytes = result['stagePeakBytes'].get(stageName)
+        peakStr = '' if peakBytes == None else ', peak %.1f MB' % (peakBytes / 1e6)
+        print('  %-8s %8.3fs%s' % (stageName, stageTime, peakStr))
+
+
+# Stage time ratios compared to an earlier results file, for export sizes and stages present in both
+def printBenchmarkComparison(benchmarks, previousBenchmarks):
+    previousResults = {result['delayCount']: result for result in previousBenchmarks['results']}
+    for result in benchmarks['results']:
+        previousResult = previousResults.get(result['delayCount'])
+        if previousResult == None: continue
+        for stageName, stageTime in result['stageTimes'].items():
+            previousTime = previousResult['stageTimes'].get(stageName)
+            if previousTime == None or previousTime <= 0: continue
+            print('%d delays %-8s %8.3fs vs %8.3fs (x%.2f)' % (result['delayCount'], stageName, stageTime, previousTime, stageTime / previousTime))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the delay analysis stages on synthetic delay exports')
+    parser.add_argument('--delays', nargs='+', type=float, default=[1e4, 1e5, 1e6], metavar='COUNT', help='numbers of delays per synthetic export, from 1e4 up to 1e8 (default: 1e4 1e5 1e6)')
+    parser.add_argument('--output', default='./data-analysis/benchmarks.json', help='JSON file to write the results to (default: ./data-analysis/benchmarks.json)')
+    parser.add_argument('--compare', metavar='FILE', help='earlier results file to compare stage times with')
+    parser.add_argument('--data-folder', help='folder to keep the synthetic exports in (default: a temporary folder)')
+    parser.add_argument('--no-memory', action='store_true', help='skip the second run that measures peak memory per stage')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the synthetic exports (default: 0)')
+    args = parser.parse_args()
+
+    benchmarks = runBenchmarks([int(delayCount) for delayCount in args.delays], args.data_folder, not args.no_memory, args.seed)
+    if os.path.dirname(args.output) != '': os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    with open(args.output, 'w') as writeFile:
+        json.dump(benchmarks, writeFile, indent=2)
+    if args.compare != None:
+        with open(args.compare, 'r') as readFile:
+            printBenchmarkComparison(benchmarks, json.load(readFile))
@@ -0,0 +1,48 @@
+import json
+import os
+import shutil
+import numpy as np
+
+
+# Caches are folders of .npy files, so they can be memory-mapped, with an info.json describing what the cache was
+# built from. A cache is built in a temporary folder and moved into place when complete, so an interrupted build never
+# leaves a partial cache behind.
+cacheInfoFileName = 'info.json'
+
+
+def readCacheInfo(cacheFolder):
+    try:
+        with open(os.path.join(cacheFolder, cacheInfoFileName), 'r') as readFile:
+            return json.load(readFile)
+    except (OSError, ValueError):
+        return None
+
+
+def writeCacheInfo(cacheFolder, cacheInfo):
+    with open(os.path.join(cacheFolder, cacheInfoFileName), 'w') as writeFile:
+        json.dump(cacheInfo, writeFile, indent=2)
+
+
+def hasCacheArrays(cacheFolder, arrayKeys):
+    return all(os.path.exists(os.path.join(cacheFolder, arrayKey + '.npy')) for arrayKey in arrayKeys)
+
+
+def saveCacheArrays(arrays, cacheFolder):
+    for arrayKey, array in arrays.items():
+        np.save(os.path.join(cacheFolder, arrayKey + '.npy'), array)
+
+
+def loadCacheArrays(cacheFolder, arrayKeys):
+    return {arrayKey: np.load(os.path.join(cacheFolder, arrayKey + '.npy'), mmap_mode='r') for arrayKey in arrayKeys}
+
+
+# Replace a cache with one whose files are written by `writeFiles(folder)`
+def buildCacheFolder(cacheFolder, cacheInfo, writeFiles):
+    tempFolder = cacheFolder + '.tmp'
+    shutil.rmtree(tempFolder, ignore_errors=True)
+    os.makedirs(tempFolder)
+    writeFiles(tempFolder)
+    writeCacheInfo(tempFolder, cacheInfo)
+
+    shutil.rmtree(cacheFolder, ignore_errors=True)
+    os.replace(tempFolder, cacheFolder)
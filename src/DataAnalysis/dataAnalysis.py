@@ -1,400 +1,726 @@
+import argparse
 import json
-from math import floor
-import matplotlib.pyplot as plt
+import os
+import sys
+import time
+from functools import partial
 import numpy as np
-import scipy.stats as stats
-from matplotlib.ticker import PercentFormatter
-from matplotlib.ticker import FuncFormatter
-
-
-instance1_10B_logCountWithoutSolution = 1
-
-instance1_10B_costProgress = [88555, 83588, 77128, 70527, 60785, 58677, 56006, 54925, 54775, 54444, 54267, 54254, 54217, 54217, 54217, 54217, 54217, 54217, 54217, 54217, 54217, 54217, 54217, 54217, 54217, 54217, 54217, 54217, 54217, 54217, 54217, 54217, 54217, 54217, 54217, 54217, 53460, 53079, 53057, 53057, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 53044, 52477, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 52356, 51666, 51428, 51210, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015, 51015]
-
-instance1_10B_satisfactionProgress = [64.75, 66.82, 67.45, 68.66, 69.01, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.51, 69.66, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67, 69.67]
-
-
-instance2_10B_logCountWithoutSolution = 3
-
-instance2_10B_costProgress = [78455, 74262, 59598, 58506, 56861, 56861, 56353, 56111, 55498, 55498, 55380, 55380, 55380, 55380, 55380, 55380, 55380, 55380, 55380, 55380, 55380, 55380, 55380, 55380, 55380, 55380, 55380, 55380, 55380, 55380, 55380, 55380, 54735, 53623, 53623, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 53311, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52823, 52713, 52643, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52620, 52318, 52272, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52271, 52245, 52238, 52184, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 52177, 51614, 51560, 51534, 51530, 51530, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527, 51527]
-
-instance2_10B_satisfactionProgress = [66.11, 66.59, 67.75, 67.75, 67.75, 67.75, 67.75, 67.75, 67.75, 67.89, 67.89, 67.89, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 67.94, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.65, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 69.81, 70.50, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51, 70.51]
-
-
-instance3_10B_logCountWithoutSolution = 5
-
-instance3_10B_costProgress = [72407, 67868, 64701, 64489, 62966, 62784, 62612, 62593, 62591, 62591, 62591, 62591, 62591, 62591, 62591, 62591, 62591, 62591, 62591, 62591, 62591, 62591, 62591, 62591, 62591, 62591, 62591, 62591, 62591, 61875, 61697, 61633, 61252, 61252, 61252, 61252, 61252, 61252, 61252, 61252, 61252, 61252, 61252, 61252, 61252, 61252, 61252, 61252, 61252, 61252, 61252, 61252, 61252, 61252, 61252, 61252, 60545, 59694, 59469, 59197, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 59124, 58825, 58818, 58818, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58814, 58612, 57829, 57684, 57671, 57657, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652, 57652]
-
-instance3_10B_satisfactionProgress = [64.59, 64.55, 64.55, 66.51, 66.51, 66.55, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 66.58, 67.47, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 67.52, 68.51, 68.52, 68.68, 68.68, 68.68, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 68.82, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53, 69.53]
-
-
+from delayData import batchDelayColumns, loadCachedDelayColumns, loadDelayColumns, streamDelayColumns
+from delaySimulation import simulateSchedule
+from delayStats import StreamingDelayStats
+from durationStats import computeMoments, fitPolynomialToMoments, getMomentsStds, regroupMoments
+from histograms import addHistograms, addHistogramsFromBinCounts, plotDistribution, plotHistogram, positiveDelayBins, seriesBins
+from plotManifest import getFigureFingerprint, readManifest, writeManifest
+from processPool import mapOnPool
+from gammaFit import bootstrapGammaFitFromCounts, computeGammaStats, fitGammaFromStats
+from robustnessCost import estimateModelParameters, evaluateRobustnessCosts
+from paretoFront import compareParetoFronts
+from saProgress import getProgressSeries, loadProgressRun
+from shardedAnalysis import analyzeShards, findShardPaths, printShardTimings
 
 
 ### Helpers
 
-def plotHistogram(values, binMin=-600, binMax=600, binSize=30, ylim=None, color=(0, 0.5, 1, 1), alpha=1, histtype='bar'):
-    count = len(values)
-    bins=np.arange(binMin, binMax + binSize, binSize)
-    weights = np.ones(count) / count
-    plt.hist(values, bins=bins, color=color, weights=weights, histtype=histtype, alpha=alpha)
-    plt.xlim([binMin, binMax])
-    plt.gca().yaxis.set_major_formatter(PercentFormatter(1)) # Show percentagess
-    if ylim != None: plt.ylim(ylim)
-
-def plotDistribution(cdfFunc, binMin=-600, binMax=600, binSize=30, ylim=None, color=(0, 0.5, 1, 1), lineWidth=1, precision=10):
-    binCount = int((binMax - binMin) / binSize) * precision
-
-    cdfPoints = np.linspace(binMin, binMax, binCount + 2)
-    scaledCdf = cdfFunc(cdfPoints)
-    cdf = [precision * cdfVal for cdfVal in scaledCdf]
-
-    groupedCdf = [cdf[i + 1] - cdf[i] for i in range(len(cdf) - 1)]
-    
-    x2 = np.linspace(binMin, binMax, binCount + 1)
-    plt.plot(x2, groupedCdf, color=color, linewidth=lineWidth)
-    if ylim != None: plt.ylim(ylim)
-
+# Figures are created through the object-oriented API, so they do not share pyplot state and can be rendered in parallel.
+# matplotlib and scipy.stats are imported by the functions that use them, so output without figures starts quickly.
 def beforePlot(xLabel=None, yLabel=None):
-    fig = plt.figure(figsize=(5,5))
-    ax = plt.subplot()
-    if (xLabel != None): plt.xlabel(xLabel)
-    if (yLabel != None): plt.ylabel(yLabel)
+    from matplotlib.figure import Figure
+    fig = Figure(figsize=(5,5))
+    ax = fig.subplots()
+    if (xLabel != None): ax.set_xlabel(xLabel)
+    if (yLabel != None): ax.set_ylabel(yLabel)
     return fig, ax
 
-def afterPlot(plotName):
-    # plt.show()
-    filePath = './data-analysis/plots/{0}.png'.format(plotName)
-    plt.savefig(filePath, dpi=300, bbox_inches='tight', pad_inches=0.1)
-    plt.close()
+def afterPlot(fig, plotName, plotsFolder):
+    filePath = os.path.join(plotsFolder, '{0}.png'.format(plotName))
+    fig.savefig(filePath, dpi=300, bbox_inches='tight', pad_inches=0.1)
 
 
 ### Output
 
 # Basic info
-def printBasicInfo(allDelays, allPositiveDelays):
-    print('Number of activities:', len(allDelays))
-    print('Number of delayed activities:', len(allPositiveDelays))
-    print('Percentage of activities delayed:', str(100 * len(allPositiveDelays) / len(allDelays)) + "%")
+def printBasicInfo(delayCount, positiveDelayCount):
+    print('Number of activities:', delayCount)
+    print('Number of delayed activities:', positiveDelayCount)
+    print('Percentage of activities delayed:', str(100 * positiveDelayCount / delayCount) + "%")
 
 
 # All delays histogram
-def plotAllDelays(allDelays):
-    beforePlot(xLabel='Delay amount (minutes)', yLabel='Share of total')
-    plotHistogram(allDelays, binMin=-300, binMax=300, binSize=10)
-    afterPlot(plotName='delays')
+def plotAllDelays(data):
+    fig, ax = beforePlot(xLabel='Delay amount (minutes)', yLabel='Share of total')
+    plotHistogram(ax, data, 'allDelays')
+    return fig
 
 
 # Positive delays histogram
-def plotAllPositiveDelays(allPositiveDelays):
-    beforePlot(xLabel='Delay amount (minutes)', yLabel='Share of total')
-    plotHistogram(allPositiveDelays, binMin=0, binMax=300, binSize=5)
-    plt.ylim([0, 0.19])
-    afterPlot(plotName='delays-positive')
+def plotAllPositiveDelays(data):
+    fig, ax = beforePlot(xLabel='Delay amount (minutes)', yLabel='Share of total')
+    plotHistogram(ax, data, 'allPositiveDelays')
+    ax.set_ylim([0, 0.19])
+    return fig
 
 
 # Driving vs non-driving info
-def printDrivingNonDrivingInfo(allDelaysDriving, allDelaysNonDriving, allPositiveDelaysDriving, allPositiveDelaysNonDriving):
-    print('Number of driving activities:', len(allDelaysDriving))
-    print('Number of non-driving activities:', len(allDelaysNonDriving))
-    print('Number of delayed driving activities:', len(allPositiveDelaysDriving))
-    print('Number of delayed non-driving activities:', len(allPositiveDelaysNonDriving))
-    print('Percentage of driving activities delayed:', str(100 * len(allPositiveDelaysDriving) / len(allDelaysDriving)) + "%")
-    print('Percentage of non-driving activities delayed:', str(100 * len(allPositiveDelaysNonDriving) / len(allDelaysNonDriving)) + "%")
+def printDrivingNonDrivingInfo(drivingCount, nonDrivingCount, positiveDrivingCount, positiveNonDrivingCount):
+    print('Number of driving activities:', drivingCount)
+    print('Number of non-driving activities:', nonDrivingCount)
+    print('Number of delayed driving activities:', positiveDrivingCount)
+    print('Number of delayed non-driving activities:', positiveNonDrivingCount)
+    print('Percentage of driving activities delayed:', str(100 * positiveDrivingCount / drivingCount) + "%")
+    print('Percentage of non-driving activities delayed:', str(100 * positiveNonDrivingCount / nonDrivingCount) + "%")
 
 
 # Delays driving vs non-driving
-def plotDelaysDrivingNonDriving(allDelaysDriving, allDelaysNonDriving):
-    beforePlot(xLabel='Delay amount (minutes)', yLabel='Share of total')
-    plotHistogram(allDelaysDriving, binMin=-300, binMax=300, binSize=10, color=(0, 0.5, 1, 1), alpha=0.6)
-    plotHistogram(allDelaysNonDriving, binMin=-300, binMax=300, binSize=10, color=(1, 0.5, 0, 1), alpha=0.6)
-    afterPlot(plotName='delays-driving-nondriving')
+def plotDelaysDrivingNonDriving(data):
+    fig, ax = beforePlot(xLabel='Delay amount (minutes)', yLabel='Share of total')
+    plotHistogram(ax, data, 'allDelaysDriving', color=(0, 0.5, 1, 1), alpha=0.6)
+    plotHistogram(ax, data, 'allDelaysNonDriving', color=(1, 0.5, 0, 1), alpha=0.6)
+    return fig
 
 
 # Positive driving vs non-driving
-def plotPositiveDelaysDrivingNonDriving(allPositiveDelaysDriving, allPositiveDelaysNonDriving):
-    beforePlot(xLabel='Delay amount (minutes)', yLabel='Share of total')
-    plotHistogram(allPositiveDelaysDriving, binMin=0, binMax=300, binSize=5, color=(0, 0.5, 1, 1), alpha=0.6)
-    plotHistogram(allPositiveDelaysNonDriving, binMin=0, binMax=300, binSize=5, color=(1, 0.5, 0, 1), alpha=0.6)
-    afterPlot(plotName='delays-positive-driving-nondriving')
+def plotPositiveDelaysDrivingNonDriving(data):
+    fig, ax = beforePlot(xLabel='Delay amount (minutes)', yLabel='Share of total')
+    plotHistogram(ax, data, 'allPositiveDelaysDriving', color=(0, 0.5, 1, 1), alpha=0.6)
+    plotHistogram(ax, data, 'allPositiveDelaysNonDriving', color=(1, 0.5, 0, 1), alpha=0.6)
+    return fig
+
+
+# Positive delays gamma distribution, fitted on the delays below `gammaFitMaxDelay`
+gammaFitMaxDelay = 600
+
+def getGammaFitDelays(allPositiveDelays):
+    return allPositiveDelays[allPositiveDelays < gammaFitMaxDelay]
 
+# Fit from the sufficient statistics of all capped positive delays
+def fitGammaDistributionToAllPositiveDelays(gammaStats):
+    return fitGammaFromStats(gammaStats)
 
-# Positive delays gamma distribution
-def fitGammaDistributionToAllPositiveDelays(allPositiveDelays):
-    allPositiveDelaysCapped = [delay for delay in allPositiveDelays if delay < 600]
-    alpha, _, scale = stats.gamma.fit(allPositiveDelaysCapped, loc=0, floc=0)
+# Coefficient of determination of the probability plot; the probability plot delays may be a sample
+def getGammaFitRSquared(alpha, scale, probplotDelays):
+    import scipy.stats as stats
+    _, (_, _, r) = stats.probplot(getGammaFitDelays(probplotDelays), dist=stats.gamma, sparams=(alpha, 0, scale))
+    return r * r
+
+def printGammaFitInfo(alpha, beta, rSquared):
     print('All positive delays gamma distribution, alpha parameter:', alpha)
-    print('All positive delays gamma distribution, beta parameter:', 1 / scale)
-
-    # Print histogram comparison
-    beforePlot(xLabel='Delay amount (minutes)', yLabel='Share of total')
-    plotHistogram(allPositiveDelays, binMin=0, binMax=300, binSize=5, ylim=None)
-    plotDistribution(lambda x: stats.gamma.cdf(x, alpha, 0, scale), binMin=0, binMax=300, binSize=5, ylim=None, color=(1, 0.5, 0, 1), lineWidth=3)
-    plt.ylim([0, 0.19])
-    afterPlot(plotName='gamma-fit-histogram')
-
-    # Print histogram comparison, presentation version
-    beforePlot(xLabel='Delay amount (minutes)', yLabel='Share of total')
-    plotHistogram(allPositiveDelays, binMin=0, binMax=300, binSize=5, ylim=None, color=(1, 0.8, 0, 1))
-    plotDistribution(lambda x: stats.gamma.cdf(x, alpha, 0, scale), binMin=0, binMax=300, binSize=5, ylim=None, color=(0.753, 0.035, 0.208, 1), lineWidth=3)
-    plt.ylim([0, 0.19])
-    afterPlot(plotName='gamma-fit-histogram-presentation')
-
-    # Print probability plot
-    _, ax = beforePlot()
-    _, (_, _, r) = stats.probplot(allPositiveDelaysCapped, dist=stats.gamma, sparams=(alpha, 0, scale), plot=plt)
-    print('Coefficient of determination R^2:', r * r)
-    plt.title('')
-    plt.xlabel('Distribution quantiles')
-    plt.ylabel('Data quantiles')
+    print('All positive delays gamma distribution, beta parameter:', beta)
+    if rSquared != None: print('Coefficient of determination R^2:', rSquared)
+
+def printGammaFitConfidenceIntervals(uniqueDelays, uniqueDelayCounts, bootstrapCount, workerCount=None):
+    intervals = bootstrapGammaFitFromCounts(uniqueDelays, uniqueDelayCounts, bootstrapCount, workerCount=workerCount)
+    print('All positive delays gamma distribution, alpha parameter 95% confidence interval:', intervals['alpha'])
+    print('All positive delays gamma distribution, beta parameter 95% confidence interval:', intervals['beta'])
+
+# Histogram comparison
+def plotGammaFitHistogram(data, histogramColor=(0, 0.5, 1, 1), distributionColor=(1, 0.5, 0, 1)):
+    import scipy.stats as stats
+    alpha, scale = data['gammaAlpha'], data['gammaScale']
+    fig, ax = beforePlot(xLabel='Delay amount (minutes)', yLabel='Share of total')
+    plotHistogram(ax, data, 'allPositiveDelays', ylim=None, color=histogramColor)
+    plotDistribution(ax, lambda x: stats.gamma.cdf(x, alpha, 0, scale), *positiveDelayBins, ylim=None, color=distributionColor, lineWidth=3)
+    ax.set_ylim([0, 0.19])
+    return fig
+
+# Probability plot
+def plotGammaFitProbplot(data):
+    import scipy.stats as stats
+    fig, ax = beforePlot()
+    stats.probplot(getGammaFitDelays(data['allPositiveDelays']), dist=stats.gamma, sparams=(data['gammaAlpha'], 0, data['gammaScale']), plot=ax)
+    ax.set_title('')
+    ax.set_xlabel('Distribution quantiles')
+    ax.set_ylabel('Data quantiles')
     ax.get_lines()[0].set_markerfacecolor((0, 0.5, 1, 0.2))
     ax.get_lines()[0].set_markeredgewidth(0)
     ax.get_lines()[1].set_color((0.7, 0.7, 0.7, 1))
     ax.get_lines()[1].set_linewidth(2)
-    afterPlot(plotName='gamma-fit-probplot')
+    return fig
+
 
+# Determine function of mean delay by duration, from the moments of the frequent positive delays by planned duration
+def fitMeanDelayFunction(frequentMomentsByPlannedDuration):
+    return fitPolynomialToMoments(frequentMomentsByPlannedDuration, 2)
 
-# Determine function of mean delay by duration
-def fitMeanDelayFunction(allPositiveDelaysFrequentDurations, allPositiveDelaysFrequent):
-    muXs = allPositiveDelaysFrequentDurations
-    muXsModel = sorted(muXs)
-    muYs = allPositiveDelaysFrequent
-    muCoef = np.polyfit(muXs, muYs, 2)
-    muFunc = lambda x: muCoef[0] * x * x + muCoef[1] * x + muCoef[2]
+def printMeanDelayFunction(muCoef):
     print('Mean delay by duration: %sx^2 + %sx + %s' % (muCoef[0], muCoef[1], muCoef[2]))
-    muYsModel = [muFunc(x) for x in muXsModel]
-
-    beforePlot(xLabel='Planned duration (minutes)', yLabel='Delay amount (minutes)')
-    plt.plot(muXs, muYs, 'o', color=(0, 0.5, 1, 0.1))
-    plt.plot(muXsModel, muYsModel, color=(1, 0.5, 0, 1), linewidth=3)
-    plt.xlim([0, 420])
-    plt.ylim([0, 600])
-    afterPlot(plotName='delays-duration-mean')
-
-
-# Determine function of delay standard deviation by duration
-def showStdScatterPlot(allPositiveDelaysByDuration, durationIndexSize):
-    beforePlot(xLabel='Planned duration (minutes)', yLabel='Delay standard deviation (minutes)')
-    stdDelayByDuration = []
-    for durationIndex in range(len(allPositiveDelaysByDuration)):
-        durationDelays = allPositiveDelaysByDuration[durationIndex]
-        if (len(durationDelays) < 5): continue
-        _, std = stats.norm.fit(durationDelays)
-        stdDelayByDuration.append(std)
-    stdYs = stdDelayByDuration[0:18]
-    stdXs = range(0, len(stdYs) * durationIndexSize, durationIndexSize)
-    plt.plot(stdXs, stdYs, 'o', color=(0, 0.5, 1, 1))
-    plt.xlim([0, 420])
-    plt.ylim([0, 600])
-    afterPlot(plotName='delays-duration-std')
 
+def plotMeanDelayFunction(data):
+    muXs = data['allPositiveDelaysFrequentDurations']
+    muXsModel = np.sort(muXs)
+    muYs = data['allPositiveDelaysFrequent']
+    muYsModel = np.polyval(data['muCoef'], muXsModel)
+
+    fig, ax = beforePlot(xLabel='Planned duration (minutes)', yLabel='Delay amount (minutes)')
+    ax.plot(muXs, muYs, 'o', color=(0, 0.5, 1, 0.1))
+    ax.plot(muXsModel, muYsModel, color=(1, 0.5, 0, 1), linewidth=3)
+    ax.set_xlim([0, 420])
+    ax.set_ylim([0, 600])
+    return fig
+
+
+# Determine function of delay standard deviation by duration, for durations rounded down to nearest `durationIndexSize`
+def getStdDelayByDuration(positiveMomentsByPlannedDuration, durationIndexSize):
+    momentsByDuration = regroupMoments(positiveMomentsByPlannedDuration, durationIndexSize)
+    return getMomentsStds(momentsByDuration)[momentsByDuration['counts'] >= 5]
+
+def plotStdByDuration(data):
+    durationIndexSize = data['durationIndexSize']
+    fig, ax = beforePlot(xLabel='Planned duration (minutes)', yLabel='Delay standard deviation (minutes)')
+    stdYs = data['stdDelayByDuration'][0:18]
+    stdXs = range(0, len(stdYs) * durationIndexSize, durationIndexSize)
+    ax.plot(stdXs, stdYs, 'o', color=(0, 0.5, 1, 1))
+    ax.set_xlim([0, 420])
+    ax.set_ylim([0, 600])
+    return fig
+
+
+# Streaming variant of the mean delay plot, showing the mean per planned duration instead of every delay
+def plotStreamedMeanDelayFunction(data):
+    moments = data['frequentMomentsByPlannedDuration']
+    hasValues = moments['counts'] > 0
+    muXs = np.flatnonzero(hasValues)
+    muYs = moments['means'][hasValues]
+
+    fig, ax = beforePlot(xLabel='Planned duration (minutes)', yLabel='Delay amount (minutes)')
+    ax.plot(muXs, muYs, 'o', color=(0, 0.5, 1, 1))
+    ax.plot(muXs, np.polyval(data['muCoef'], muXs), color=(1, 0.5, 0, 1), linewidth=3)
+    ax.set_xlim([0, 420])
+    ax.set_ylim([0, 600])
+    return fig
+
+
+# Robustness cost model parameters as re-estimated from the fits, for the planner settings
+def getRobustnessModelInfo(muCoef, gammaAlpha, gammaScale):
+    meanDelayCoefs, gammaDistributionDivisor = estimateModelParameters(muCoef, gammaAlpha, 1 / gammaScale)
+    return {'meanDelayCoefs': meanDelayCoefs, 'gammaDistributionDivisor': gammaDistributionDivisor}
+
+def printRobustnessModelInfo(muCoef, gammaAlpha, gammaScale):
+    meanDelayCoefs, gammaDistributionDivisor = estimateModelParameters(muCoef, gammaAlpha, 1 / gammaScale)
+    print('Robustness model mean delay by duration: x^2 / %s + %sx + %s' % (1 / meanDelayCoefs[0], meanDelayCoefs[1], meanDelayCoefs[2]))
+    print('Robustness model gamma distribution divisor:', gammaDistributionDivisor)
+
+
+# Robustness cost examples, evaluated together as (planned duration, waiting time, delay probability, conflict cost)
+robustnessCostExamples = [
+    ('Example 1', 60, 0, 0.275, 0),
+    ('Example 2', 30, 60, 0.275, 500),
+    ('Example 3', 120, 30, 0.275, 1000),
+]
+
+# Given values and results of each example
+def getRobustnessCostExamplesInfo():
+    exampleTitles, plannedDurations, waitingTimes, delayProbs, conflictCosts = zip(*robustnessCostExamples)
+    results = evaluateRobustnessCosts(plannedDurations, waitingTimes, delayProbs, conflictCosts)
+    examplesInfo = []
+    for exampleIndex, exampleTitle in enumerate(exampleTitles):
+        examplesInfo.append({
+            'title': exampleTitle,
+            'plannedDuration': plannedDurations[exampleIndex],
+            'waitingTime': waitingTimes[exampleIndex],
+            'delayProb': delayProbs[exampleIndex],
+            'conflictCost': conflictCosts[exampleIndex],
+            **{key: values[exampleIndex] for key, values in results.items()},
+        })
+    return examplesInfo
 
 def printRobustnessCostExamplesInfo():
-    printRobustnessCostSingleExample(60, 0, 0.275, 0, 'Example 1')
-    printRobustnessCostSingleExample(30, 60, 0.275, 500, 'Example 2')
-    printRobustnessCostSingleExample(120, 30, 0.275, 1000, 'Example 3')
+    for exampleInfo in getRobustnessCostExamplesInfo():
+        printRobustnessCostSingleExample(exampleInfo['plannedDuration'], exampleInfo['waitingTime'], exampleInfo['delayProb'], exampleInfo['conflictCost'], exampleInfo['title'], exampleInfo)
     print()
 
-def printRobustnessCostSingleExample(plannedDuration, waitingTime, delayProb, conflictCost, exampleTitle):
-    meanDelay = plannedDuration * plannedDuration / 5571 + 0.123 * plannedDuration + 37.38
-    alpha = meanDelay * meanDelay / 3879
-    beta = meanDelay / 3879
-
-    conflictProbIfDelayed = 1 - stats.gamma.cdf(waitingTime, alpha, 0, 1 / beta)
-    conflictProb = delayProb * conflictProbIfDelayed
-    robustnessCost = conflictProb * conflictCost
-
+def printRobustnessCostSingleExample(plannedDuration, waitingTime, delayProb, conflictCost, exampleTitle, results):
     print()
     print('Robustness cost example:', exampleTitle)
     print('Given planned duration:', plannedDuration)
     print('Given waiting time:', waitingTime)
-    print('Mean delay:', meanDelay)
-    print('Gamma distribution alpha parameter:', alpha)
-    print('Gamma distribution beta parameter:', beta)
-    print('Conflict probability if delayed:', conflictProbIfDelayed)
+    print('Mean delay:', results['meanDelays'])
+    print('Gamma distribution alpha parameter:', results['alphas'])
+    print('Gamma distribution beta parameter:', results['betas'])
+    print('Conflict probability if delayed:', results['conflictProbsIfDelayed'])
     print('Given delay probability:', delayProb)
-    print('Conflict probability:', conflictProb)
+    print('Conflict probability:', results['conflictProbs'])
     print('Given conflict cost:', conflictCost)
-    print('Robustness cost:', robustnessCost)
-
-
-def plotSimulatedAnnealingProgress():
-    # Progress per 10M iterations for a total of 10B iterations
-    iterationCount = 10000000000
-    logFrequency = 10000000
-    logCount = int(iterationCount / logFrequency)
-
+    print('Robustness cost:', results['robustnessCosts'])
+
+# Simulate the robustness cost examples as consecutive activities of one driver, to compare the analytic conflict
+# probabilities with those including knock-on delays from earlier activities
+def getDelaySimulationInfo(scenarioCount, workerCount=None):
+    exampleTitles, plannedDurations, waitingTimes, delayProbs, conflictCosts = zip(*robustnessCostExamples)
+    results = simulateSchedule(np.zeros(len(exampleTitles)), plannedDurations, waitingTimes, delayProbs, conflictCosts, scenarioCount, workerCount=workerCount)
+    return [{'title': exampleTitle, **{key: values[exampleIndex] for key, values in results.items() if key != 'scenarioCount'}} for exampleIndex, exampleTitle in enumerate(exampleTitles)]
+
+def printDelaySimulationInfo(scenarioCount, workerCount=None):
+    print('Simulated %d scenarios of the robustness cost examples as one driver schedule' % scenarioCount)
+    for exampleInfo in getDelaySimulationInfo(scenarioCount, workerCount):
+        print('%s: analytic conflict probability %.4f, simulated %.4f without and %.4f ± %.4f with knock-on delays, robustness cost %.2f analytic vs %.2f simulated' % (exampleInfo['title'], exampleInfo['analyticConflictProbs'], exampleInfo['independentConflictProbs'], exampleInfo['propagatedConflictProbs'], exampleInfo['propagatedConflictProbStds'], exampleInfo['analyticRobustnessCosts'], exampleInfo['propagatedRobustnessCosts']))
+
+
+# Runs as (label, run output folder or summary file), logged per 10M iterations for a total of 10B iterations
+saProgressFolder = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'saRuns')
+saProgressRuns = [
+    ('Instance 1', os.path.join(saProgressFolder, 'instance1-10B')),
+    ('Instance 2', os.path.join(saProgressFolder, 'instance2-10B')),
+    ('Instance 3', os.path.join(saProgressFolder, 'instance3-10B')),
+]
+saIterationCount = 10000000000
+
+# Progressions are downsampled to the horizontal pixel count of the progress figures
+saProgressBucketCount = 1500
+
+# Add the downsampled progressions of each run to the render data. Runs without progressions, like runs that found no
+# valid solution, are skipped with a warning.
+def addSaProgress(data, progressRuns=saProgressRuns):
+    data['saProgress'] = []
+    for label, filePath in progressRuns:
+        try:
+            progressRun = loadProgressRun(filePath, saIterationCount)
+        except (OSError, ValueError) as error:
+            print('Skipping SA run {0}: {1}'.format(label, error), file=sys.stderr)
+            continue
+        if len(progressRun['costProgress']) == 0:
+            print('Skipping SA run {0}: no solution was logged'.format(label), file=sys.stderr)
+            continue
+        data['saProgress'].append({
+            'label': label,
+            'iterationCount': progressRun['iterationCount'],
+            'costProgress': getProgressSeries(progressRun, 'costProgress', saProgressBucketCount),
+            'satisfactionProgress': getProgressSeries(progressRun, 'satisfactionProgress', saProgressBucketCount),
+        })
+
+def plotSimulatedAnnealingProgress(data, yLabel, seriesName, getReference, ylim):
+    from matplotlib.ticker import FuncFormatter
+    iterationCount = max((runProgress['iterationCount'] for runProgress in data['saProgress']), default=saIterationCount)
     iterationTicks = np.linspace(0, iterationCount, 6)
 
     iterationFormatter = FuncFormatter(lambda x, pos: '%1.1fB' % (x * 1e-9))
     relativeValueFormatter = FuncFormatter(lambda x, pos: '%1.0f' % (x * 100) + '%')
 
-    instance1_10B_iterationNums = np.linspace(logFrequency * instance1_10B_logCountWithoutSolution, iterationCount, logCount - instance1_10B_logCountWithoutSolution)
-    instance2_10B_iterationNums = np.linspace(logFrequency * instance2_10B_logCountWithoutSolution, iterationCount, logCount - instance2_10B_logCountWithoutSolution)
-    instance3_10B_iterationNums = np.linspace(logFrequency * instance3_10B_logCountWithoutSolution, iterationCount, logCount - instance3_10B_logCountWithoutSolution)
-
-    instance1_10B_relativeCostProgress = [cost / min(instance1_10B_costProgress) for cost in instance1_10B_costProgress]
-    instance2_10B_relativeCostProgress = [cost / min(instance2_10B_costProgress) for cost in instance2_10B_costProgress]
-    instance3_10B_relativeCostProgress = [cost / min(instance3_10B_costProgress) for cost in instance3_10B_costProgress]
-
-    _, ax = beforePlot(xLabel='Iterations', yLabel='Relative cost')
+    fig, ax = beforePlot(xLabel='Iterations', yLabel=yLabel)
     ax.xaxis.set_major_formatter(iterationFormatter)
     ax.yaxis.set_major_formatter(relativeValueFormatter)
-    plt.plot(instance1_10B_iterationNums, instance1_10B_relativeCostProgress, color=(0, 0.5, 1, 0.8), label='Instance 1')
-    plt.plot(instance2_10B_iterationNums, instance2_10B_relativeCostProgress, color=(1, 0.5, 0, 0.8), label='Instance 2')
-    plt.plot(instance3_10B_iterationNums, instance3_10B_relativeCostProgress, color=(0.25, 0.75, 0.25, 0.8), label='Instance 3')
-    plt.xticks(iterationTicks)
-    plt.ylim([0.99, 1.14])
-    plt.legend()
-    afterPlot(plotName='sa-progress-cost-relative')
-
-    instance1_10B_relativeSatisfactionProgress = [cost / max(instance1_10B_satisfactionProgress) for cost in instance1_10B_satisfactionProgress]
-    instance2_10B_relativeSatisfactionProgress = [cost / max(instance2_10B_satisfactionProgress) for cost in instance2_10B_satisfactionProgress]
-    instance3_10B_relativeSatisfactionProgress = [cost / max(instance3_10B_satisfactionProgress) for cost in instance3_10B_satisfactionProgress]
-
-    _, ax = beforePlot(xLabel='Iterations', yLabel='Relative satisfaction')
-    ax.xaxis.set_major_formatter(iterationFormatter)
-    ax.yaxis.set_major_formatter(relativeValueFormatter)
-    plt.plot(instance1_10B_iterationNums, instance1_10B_relativeSatisfactionProgress, color=(0, 0.5, 1, 0.8), label='Instance 1')
-    plt.plot(instance2_10B_iterationNums, instance2_10B_relativeSatisfactionProgress, color=(1, 0.5, 0, 0.8), label='Instance 2')
-    plt.plot(instance3_10B_iterationNums, instance3_10B_relativeSatisfactionProgress, color=(0.25, 0.75, 0.25, 0.8), label='Instance 3')
-    plt.xticks(iterationTicks)
-    plt.ylim([0.94, 1.004])
-    plt.legend()
-    afterPlot(plotName='sa-progress-satisfaction-relative')
+    colors = [(0, 0.5, 1, 0.8), (1, 0.5, 0, 0.8), (0.25, 0.75, 0.25, 0.8)]
+    for runIndex, runProgress in enumerate(data['saProgress']):
+        iterationNums, progress = runProgress[seriesName]
+        ax.plot(iterationNums, progress / getReference(progress), color=colors[runIndex % len(colors)], label=runProgress['label'])
+    ax.set_xticks(iterationTicks)
+    ax.set_ylim(ylim)
+    ax.legend()
+    return fig
 
+def plotSimulatedAnnealingCostProgress(data):
+    return plotSimulatedAnnealingProgress(data, 'Relative cost', 'costProgress', np.min, [0.99, 1.14])
 
-def plotSimulatedAnnealingParetoFront():
-    # Instance 1: 27/6 - 3/7
-    costsInstance1_1B = [52472, 52976, 54020, 55385, 56255]
-    satisfactionsInstance1_1B = [50.46, 51.51, 65.73, 68.09, 68.93]
-    costsInstance1_4B = [51820, 52778, 53358, 54485, 55692]
-    satisfactionsInstance1_4B = [53.53, 63.52, 65.53, 67.61, 69.65]
-    costsInstance1_10B = [51015, 51776, 52589, 53116, 54042, 54791, 55722, 56223]
-    satisfactionsInstance1_10B = [49.51, 52.50, 64.23, 64.69, 66.80, 67.50, 68.52, 69.67]
+def plotSimulatedAnnealingSatisfactionProgress(data):
+    return plotSimulatedAnnealingProgress(data, 'Relative satisfaction', 'satisfactionProgress', np.max, [0.94, 1.004])
 
-    # Instance 2: 20/6 - 26/6
-    costsInstance2_1B = [52740, 53766, 54943, 55629, 58112]
-    satisfactionsInstance2_1B = [53.65, 57.21, 67.51, 68.51, 69.59]
-    costsInstance2_4B = [52544, 53388, 54355, 55535, 57041]
-    satisfactionsInstance2_4B = [51.52, 55.86, 66.51, 68.91, 69.74]
-    costsInstance2_10B = [51527, 52177, 53037, 53603, 54245, 55149, 56274, 56957, 59252]
-    satisfactionsInstance2_10B = [48.05, 50.51, 57.50, 65.51, 66.89, 67.59, 68.56, 69.66, 70.51]
 
+# Pareto fronts as (costs, satisfactions) by instance and iteration count
+saParetoFronts = {
+    # Instance 1: 27/6 - 3/7
+    1: {
+        '1B': ([52472, 52976, 54020, 55385, 56255], [50.46, 51.51, 65.73, 68.09, 68.93]),
+        '4B': ([51820, 52778, 53358, 54485, 55692], [53.53, 63.52, 65.53, 67.61, 69.65]),
+        '10B': ([51015, 51776, 52589, 53116, 54042, 54791, 55722, 56223], [49.51, 52.50, 64.23, 64.69, 66.80, 67.50, 68.52, 69.67]),
+    },
+    # Instance 2: 20/6 - 26/6
+    2: {
+        '1B': ([52740, 53766, 54943, 55629, 58112], [53.65, 57.21, 67.51, 68.51, 69.59]),
+        '4B': ([52544, 53388, 54355, 55535, 57041], [51.52, 55.86, 66.51, 68.91, 69.74]),
+        '10B': ([51527, 52177, 53037, 53603, 54245, 55149, 56274, 56957, 59252], [48.05, 50.51, 57.50, 65.51, 66.89, 67.59, 68.56, 69.66, 70.51]),
+    },
     # Instance 3: 13/6 - 19/6
-    costsInstance3_1B = [58605, 60893, 61502]
-    satisfactionsInstance3_1B = [55.52, 67.04, 67.51]
-    costsInstance3_4B = [59149, 59764, 60808, 62022, 63412]
-    satisfactionsInstance3_4B = [54.86, 64.55, 66.17, 67.94, 68.51]
-    costsInstance3_10B = [57652, 58594, 59337, 60849, 61369, 63302, 65191]
-    satisfactionsInstance3_10B = [51.73, 54.51, 65.70, 66.53, 67.55, 68.82, 69.53]
-
+    3: {
+        '1B': ([58605, 60893, 61502], [55.52, 67.04, 67.51]),
+        '4B': ([59149, 59764, 60808, 62022, 63412], [54.86, 64.55, 66.17, 67.94, 68.51]),
+        '10B': ([57652, 58594, 59337, 60849, 61369, 63302, 65191], [51.73, 54.51, 65.70, 66.53, 67.55, 68.82, 69.53]),
+    },
+}
+
+def beforeParetoFrontPlot():
+    from matplotlib.ticker import FuncFormatter
     costFormatter = FuncFormatter(lambda x, _: '%1.0fk' % (x / 1000))
     satisfactionFormatter = FuncFormatter(lambda x, _: str(x) + '%')
 
-    _, ax = beforePlot(xLabel='Cost', yLabel='Satisfaction')
-    ax.xaxis.set_major_formatter(costFormatter)
-    ax.yaxis.set_major_formatter(satisfactionFormatter)
-    plt.plot(costsInstance1_10B, satisfactionsInstance1_10B, 'o-', color=(0, 0.5, 1, 1), label='10B iterations')
-    plt.plot(costsInstance1_4B, satisfactionsInstance1_4B, 'o-', color=(1, 0.5, 0, 1), label='4B iterations')
-    plt.plot(costsInstance1_1B, satisfactionsInstance1_1B, 'o-', color=(0.25, 0.75, 0.255, 1), label='1B iterations')
-    plt.legend()
-    afterPlot(plotName='sa-pareto-front-instance1-short-long')
-
-    _, ax = beforePlot(xLabel='Cost', yLabel='Satisfaction')
+    fig, ax = beforePlot(xLabel='Cost', yLabel='Satisfaction')
     ax.xaxis.set_major_formatter(costFormatter)
     ax.yaxis.set_major_formatter(satisfactionFormatter)
-    plt.plot(costsInstance2_10B, satisfactionsInstance2_10B, 'o-', color=(0, 0.5, 1, 1), label='10B iterations')
-    plt.plot(costsInstance2_4B, satisfactionsInstance2_4B, 'o-', color=(1, 0.5, 0, 1), label='4B iterations')
-    plt.plot(costsInstance2_1B, satisfactionsInstance2_1B, 'o-', color=(0.25, 0.75, 0.25, 1), label='1B iterations')
-    plt.legend()
-    afterPlot(plotName='sa-pareto-front-instance2-short-long')
-
-    _, ax = beforePlot(xLabel='Cost', yLabel='Satisfaction')
-    ax.xaxis.set_major_formatter(costFormatter)
-    ax.yaxis.set_major_formatter(satisfactionFormatter)
-    plt.plot(costsInstance3_10B, satisfactionsInstance3_10B, 'o-', color=(0, 0.5, 1, 1), label='10B iterations')
-    plt.plot(costsInstance3_4B, satisfactionsInstance3_4B, 'o-', color=(1, 0.5, 0, 1), label='4B iterations')
-    plt.plot(costsInstance3_1B, satisfactionsInstance3_1B, 'o-', color=(0.25, 0.75, 0.25, 1), label='1B iterations')
-    plt.legend()
-    afterPlot(plotName='sa-pareto-front-instance3-short-long')
-
-    # Presentation variants
-    _, ax = beforePlot(xLabel='Cost', yLabel='Satisfaction')
-    ax.xaxis.set_major_formatter(costFormatter)
-    ax.yaxis.set_major_formatter(satisfactionFormatter)
-    plt.plot(costsInstance1_4B, satisfactionsInstance1_4B, 'o-', color=(0.753, 0.035, 0.208, 1), label='4B iterations')
-    afterPlot(plotName='sa-pareto-front-instance1-presentation')
-
-    _, ax = beforePlot(xLabel='Cost', yLabel='Satisfaction')
-    ax.xaxis.set_major_formatter(costFormatter)
-    ax.yaxis.set_major_formatter(satisfactionFormatter)
-    plt.plot(costsInstance2_4B, satisfactionsInstance2_4B, 'o-', color=(0.753, 0.035, 0.208, 1), label='4B iterations')
-    afterPlot(plotName='sa-pareto-front-instance2-presentation')
+    return fig, ax
 
-    _, ax = beforePlot(xLabel='Cost', yLabel='Satisfaction')
-    ax.xaxis.set_major_formatter(costFormatter)
-    ax.yaxis.set_major_formatter(satisfactionFormatter)
-    plt.plot(costsInstance3_4B, satisfactionsInstance3_4B, 'o-', color=(0.753, 0.035, 0.208, 1), label='4B iterations')
-    afterPlot(plotName='sa-pareto-front-instance3-presentation')
+def plotSimulatedAnnealingParetoFront(data, instanceNum):
+    fronts = saParetoFronts[instanceNum]
+    fig, ax = beforeParetoFrontPlot()
+    ax.plot(*fronts['10B'], 'o-', color=(0, 0.5, 1, 1), label='10B iterations')
+    ax.plot(*fronts['4B'], 'o-', color=(1, 0.5, 0, 1), label='4B iterations')
+    ax.plot(*fronts['1B'], 'o-', color=(0.25, 0.75, 0.25, 1), label='1B iterations')
+    ax.legend()
+    return fig
+
+# Presentation variant
+def plotSimulatedAnnealingParetoFrontPresentation(data, instanceNum):
+    fig, ax = beforeParetoFrontPlot()
+    ax.plot(*saParetoFronts[instanceNum]['4B'], 'o-', color=(0.753, 0.035, 0.208, 1), label='4B iterations')
+    return fig
+
+# Compare the fronts of shorter runs to the 10B-iteration front of the same instance
+def getParetoFrontComparisons(referenceIterations='10B'):
+    comparisons = []
+    for instanceNum, fronts in saParetoFronts.items():
+        for iterations, front in fronts.items():
+            if iterations == referenceIterations: continue
+            comparison = compareParetoFronts(front, fronts[referenceIterations])
+            comparisons.append({'instanceNum': instanceNum, 'iterations': iterations, 'referenceIterations': referenceIterations, **comparison})
+    return comparisons
+
+def printParetoFrontComparisons(referenceIterations='10B'):
+    for comparison in getParetoFrontComparisons(referenceIterations):
+        print('Instance %d Pareto front %s vs %s: hypervolume ratio %.3f, GD %.4f, IGD %.4f, additive epsilon %.4f' % (comparison['instanceNum'], comparison['iterations'], comparison['referenceIterations'], comparison['hypervolumeRatio'], comparison['generationalDistance'], comparison['invertedGenerationalDistance'], comparison['additiveEpsilon']))
+
+
+### Figures
+
+# Figures by plot name, as the function that draws the figure from the shared render data and the data keys it reads
+delayFigures = {
+    'delays': (plotAllDelays, ['allDelaysHistogram']),
+    'delays-positive': (plotAllPositiveDelays, ['allPositiveDelaysHistogram']),
+    'delays-driving-nondriving': (plotDelaysDrivingNonDriving, ['allDelaysDrivingHistogram', 'allDelaysNonDrivingHistogram']),
+    'delays-positive-driving-nondriving': (plotPositiveDelaysDrivingNonDriving, ['allPositiveDelaysDrivingHistogram', 'allPositiveDelaysNonDrivingHistogram']),
+    'gamma-fit-histogram': (plotGammaFitHistogram, ['allPositiveDelaysHistogram', 'gammaAlpha', 'gammaScale']),
+    'gamma-fit-histogram-presentation': (partial(plotGammaFitHistogram, histogramColor=(1, 0.8, 0, 1), distributionColor=(0.753, 0.035, 0.208, 1)), ['allPositiveDelaysHistogram', 'gammaAlpha', 'gammaScale']),
+    'gamma-fit-probplot': (plotGammaFitProbplot, ['allPositiveDelays', 'gammaAlpha', 'gammaScale']),
+    'delays-duration-mean': (plotMeanDelayFunction, ['allPositiveDelaysFrequentDurations', 'allPositiveDelaysFrequent', 'muCoef']),
+    'delays-duration-std': (plotStdByDuration, ['stdDelayByDuration', 'durationIndexSize']),
+}
+
+streamedDelayFigures = {
+    **delayFigures,
+    'delays-duration-mean': (plotStreamedMeanDelayFunction, ['frequentMomentsByPlannedDuration', 'muCoef']),
+}
+
+# The SA Pareto front figures read module-level data, which is part of their code fingerprint
+saFigures = {
+    'sa-progress-cost-relative': (plotSimulatedAnnealingCostProgress, ['saProgress']),
+    'sa-progress-satisfaction-relative': (plotSimulatedAnnealingSatisfactionProgress, ['saProgress']),
+    'sa-pareto-front-instance1-short-long': (partial(plotSimulatedAnnealingParetoFront, instanceNum=1), []),
+    'sa-pareto-front-instance2-short-long': (partial(plotSimulatedAnnealingParetoFront, instanceNum=2), []),
+    'sa-pareto-front-instance3-short-long': (partial(plotSimulatedAnnealingParetoFront, instanceNum=3), []),
+    'sa-pareto-front-instance1-presentation': (partial(plotSimulatedAnnealingParetoFrontPresentation, instanceNum=1), []),
+    'sa-pareto-front-instance2-presentation': (partial(plotSimulatedAnnealingParetoFrontPresentation, instanceNum=2), []),
+    'sa-pareto-front-instance3-presentation': (partial(plotSimulatedAnnealingParetoFrontPresentation, instanceNum=3), []),
+}
+
+plotNames = list(delayFigures) + list(saFigures)
+
+
+### Rendering
+
+def renderFigure(figures, data, plotsFolder, plotName):
+    startTime = time.perf_counter()
+    figureFunction, _ = figures[plotName]
+    fig = figureFunction(data)
+    afterPlot(fig, plotName, plotsFolder)
+    return plotName, time.perf_counter() - startTime
+
+# Render the selected figures as independent jobs on a process pool, with the render data sent to each worker once.
+# Figures whose fingerprint matches the manifest in the plots folder are skipped, unless `force` is set.
+def renderFigures(figures, data, selectedPlotNames=None, plotsFolder='./data-analysis/plots', workerCount=None, force=False):
+    if selectedPlotNames == None: selectedPlotNames = list(figures)
+    unknownPlotNames = [plotName for plotName in selectedPlotNames if plotName not in figures]
+    if len(unknownPlotNames) > 0: raise ValueError('Unknown plot names: {0}'.format(', '.join(unknownPlotNames)))
+
+    manifest = readManifest(plotsFolder)
+    fingerprints = {}
+    inputFingerprints = {}
+    for plotName in selectedPlotNames:
+        figureFunction, inputKeys = figures[plotName]
+        fingerprints[plotName] = getFigureFingerprint(figureFunction, inputKeys, data, inputFingerprints, saveFunction=afterPlot)
+    isUpToDate = lambda plotName: manifest.get(plotName) == fingerprints[plotName] and os.path.exists(os.path.join(plotsFolder, plotName + '.png'))
+    changedPlotNames = [plotName for plotName in selectedPlotNames if force or not isUpToDate(plotName)]
+    if len(changedPlotNames) == 0: return []
+
+    os.makedirs(plotsFolder, exist_ok=True)
+    renderTimes = mapOnPool(renderFigure, [changedPlotNames], workerCount, (figures, data, plotsFolder))
+
+    manifest = readManifest(plotsFolder)
+    manifest.update({plotName: fingerprints[plotName] for plotName in changedPlotNames})
+    writeManifest(plotsFolder, manifest)
+    return renderTimes
+
+
+### Processing
+
+# Derive the delay series used by the output functions from flattened delay columns
+def processDelayColumns(columns):
+    allDelays = columns['durationDelays']
+    plannedDurations = columns['plannedDurations']
+    activityIndices = columns['activityIndices']
+    isDriving = columns['isDriving']
+    isPositive = allDelays > 0
+
+    # Activities with at least 5 positive delays
+    activityCount = activityIndices[-1] + 1 if len(activityIndices) > 0 else 0
+    positiveCountByActivity = np.bincount(activityIndices[isPositive], minlength=activityCount)
+    isFrequent = isPositive & (positiveCountByActivity[activityIndices] >= 5)
+
+    return {
+        'allDelays': allDelays,
+        'allDelaysDriving': allDelays[isDriving],
+        'allDelaysNonDriving': allDelays[~isDriving],
+        'allPositiveDelays': allDelays[isPositive],
+        'allPositiveDelaysDriving': allDelays[isPositive & isDriving],
+        'allPositiveDelaysNonDriving': allDelays[isPositive & ~isDriving],
+        'allPositiveDelaysFrequent': allDelays[isFrequent],
+        'allPositiveDelaysFrequentDurations': plannedDurations[isFrequent],
+        'positiveMomentsByPlannedDuration': computeMoments(plannedDurations[isPositive], allDelays[isPositive]),
+        'frequentMomentsByPlannedDuration': computeMoments(plannedDurations[isFrequent], allDelays[isFrequent]),
+    }
 
 
 ### Run
 
-def run(durationIndexSize):
-    # Read data
-    with open('./output/delays.json', 'r') as readFile:
-        data = json.load(readFile)
-    activities = data['activities']
-
-    # Process data
-    allDelays = []
-    allDelaysDriving = []
-    allDelaysNonDriving = []
-    allPositiveDelays = []
-    allPositiveDelaysDriving = []
-    allPositiveDelaysNonDriving = []
-    allPositiveDelaysFrequent = []
-    allPositiveDelaysFrequentDurations = []
-    allPositiveDelaysByDuration = [] # durations rounded down to nearest `durationIndexSize`
-    delayedCountByDuration = []
-    for activity in activities:
-        plannedDuration = activity['plannedDuration']
-        delays = activity['durationDelays']
-        allDelays.extend(delays)
-        positiveDelays = [delay for delay in delays if delay > 0]
-        allPositiveDelays.extend(positiveDelays)
-
-        if activity['description'] == 'Drive train':
-            allDelaysDriving.extend(delays)
-            allPositiveDelaysDriving.extend(positiveDelays)
-        else:
-            allDelaysNonDriving.extend(delays)
-            allPositiveDelaysNonDriving.extend(positiveDelays)
-
-        durationIndex = floor(plannedDuration / durationIndexSize)
-        while len(allPositiveDelaysByDuration) < durationIndex + 1:
-            allPositiveDelaysByDuration.append([])
-            delayedCountByDuration.append(0)
-        allPositiveDelaysByDuration[durationIndex].extend(positiveDelays)
-        delayedCountByDuration[durationIndex] += len(positiveDelays)
-
-        if len(positiveDelays) >= 5:
-            allPositiveDelaysFrequent.extend(positiveDelays)
-            for _ in range(len(positiveDelays)):
-                allPositiveDelaysFrequentDurations.append(plannedDuration)
-
-    # Perform output
-    printBasicInfo(allDelays, allPositiveDelays)
-    plotAllDelays(allDelays)
-    plotAllPositiveDelays(allPositiveDelays)
-    printDrivingNonDrivingInfo(allDelaysDriving, allDelaysNonDriving, allPositiveDelaysDriving, allPositiveDelaysNonDriving)
-    plotDelaysDrivingNonDriving(allDelaysDriving, allDelaysNonDriving)
-    plotPositiveDelaysDrivingNonDriving(allPositiveDelaysDriving, allPositiveDelaysNonDriving)
-    fitGammaDistributionToAllPositiveDelays(allPositiveDelays)
-    fitMeanDelayFunction(allPositiveDelaysFrequentDurations, allPositiveDelaysFrequent)
-    showStdScatterPlot(allPositiveDelaysByDuration, durationIndexSize)
+# Export size above which `run` reads the delays in streaming mode
+streamingFileSize = 200 * 1024 * 1024
+
+# Output sections in the order of a full run. Only the plots section needs matplotlib.
+outputSections = ['stats', 'fit', 'robustness', 'pareto', 'plots']
+delaySections = ['stats', 'fit', 'robustness', 'plots']
+fitSections = ['fit', 'robustness', 'plots']
+
+# Render data and summary of the delays of one export, read in memory or streaming, or of several exports together.
+# The summary holds what the output needs besides the render data: the counts, gamma fit statistics and which
+# figures fit the data.
+def readDelayData(durationIndexSize, filePath='./output/delays.json', streaming=None, useCache=True, shardPatterns=None, workerCount=None):
+    if shardPatterns != None:
+        delayStats, shardInfos, reduceTime = analyzeShards(findShardPaths(shardPatterns), workerCount, useCache)
+        data, summary = getStreamedDelayData(delayStats, durationIndexSize)
+        summary['shardInfos'], summary['reduceTime'] = shardInfos, reduceTime
+        return data, summary
+
+    # Large exports are cached batch by batch and analysed batch by batch from the cache, or from the export itself
+    # without the cache
+    if streaming == None: streaming = os.path.getsize(filePath) > streamingFileSize
+    if not streaming:
+        columns = loadCachedDelayColumns(filePath) if useCache else loadDelayColumns(filePath)
+        return getDelayData(columns, durationIndexSize)
+
+    delayStats = StreamingDelayStats()
+    batches = batchDelayColumns(loadCachedDelayColumns(filePath, streaming=True)) if useCache else streamDelayColumns(filePath)
+    for columns in batches:
+        delayStats.add(columns)
+    return getStreamedDelayData(delayStats, durationIndexSize)
+
+def getDelayData(columns, durationIndexSize):
+    data = processDelayColumns(columns)
+    data['durationIndexSize'] = durationIndexSize
+    addHistograms(data)
+    summary = {
+        'counts': {seriesName: len(data[seriesName]) for seriesName in seriesBins},
+        'sampleSize': None,
+        'gammaStats': computeGammaStats(getGammaFitDelays(data['allPositiveDelays'])),
+        'delayFigures': delayFigures,
+    }
+    return data, summary
+
+# The histograms, fits and standard deviations of streamed delays are exact, while the probability plot uses a uniform
+# reservoir sample of the positive delays
+def getStreamedDelayData(delayStats, durationIndexSize):
+    data = {
+        'durationIndexSize': durationIndexSize,
+        'allPositiveDelays': delayStats.getPositiveSample(),
+        'positiveMomentsByPlannedDuration': delayStats.positiveMomentsByPlannedDuration,
+        'frequentMomentsByPlannedDuration': delayStats.frequentMomentsByPlannedDuration,
+    }
+    addHistogramsFromBinCounts(data, delayStats.binCounts, delayStats.counts)
+    summary = {
+        'counts': delayStats.counts,
+        'sampleSize': len(data['allPositiveDelays']),
+        'gammaStats': delayStats.positiveGammaStats,
+        'gammaFitValueCounts': delayStats.positiveValueCounts,
+        'delayFigures': streamedDelayFigures,
+    }
+    return data, summary
+
+# Unique capped positive delays and their counts, for the bootstrap
+def getGammaFitValueCounts(data, summary):
+    if 'gammaFitValueCounts' not in summary: return np.unique(getGammaFitDelays(data['allPositiveDelays']), return_counts=True)
+    valueCounts = summary['gammaFitValueCounts']
+    uniqueDelays = np.flatnonzero(valueCounts)
+    return uniqueDelays, valueCounts[uniqueDelays]
+
+def fitDelayModel(data, summary):
+    data['gammaAlpha'], data['gammaBeta'] = fitGammaDistributionToAllPositiveDelays(summary['gammaStats'])
+    data['gammaScale'] = 1 / data['gammaBeta']
+    data['muCoef'] = fitMeanDelayFunction(data['frequentMomentsByPlannedDuration'])
+    data['stdDelayByDuration'] = getStdDelayByDuration(data['positiveMomentsByPlannedDuration'], data['durationIndexSize'])
+
+
+# Sections as text
+def printDelayStats(summary):
+    if 'shardInfos' in summary: printShardTimings(summary['shardInfos'], summary['reduceTime'])
+    counts = summary['counts']
+    printBasicInfo(counts['allDelays'], counts['allPositiveDelays'])
+    printDrivingNonDrivingInfo(counts['allDelaysDriving'], counts['allDelaysNonDriving'], counts['allPositiveDelaysDriving'], counts['allPositiveDelaysNonDriving'])
+    if summary['sampleSize'] != None: print('Positive delays sample size:', summary['sampleSize'])
+
+# The R^2 of the gamma fit is left out of the fit output without `includeRSquared`, as it is the only part of the
+# output without figures that needs scipy.stats
+def printDelayModelFit(data, summary, bootstrapCount=0, includeRSquared=True, workerCount=None):
+    rSquared = getGammaFitRSquared(data['gammaAlpha'], data['gammaScale'], data['allPositiveDelays']) if includeRSquared else None
+    printGammaFitInfo(data['gammaAlpha'], data['gammaBeta'], rSquared)
+    if bootstrapCount > 0: printGammaFitConfidenceIntervals(*getGammaFitValueCounts(data, summary), bootstrapCount, workerCount)
+    printMeanDelayFunction(data['muCoef'])
+
+def printRobustnessInfo(data, simulationCount=0, workerCount=None):
+    printRobustnessModelInfo(data['muCoef'], data['gammaAlpha'], data['gammaScale'])
     printRobustnessCostExamplesInfo()
-    plotSimulatedAnnealingProgress()
-    plotSimulatedAnnealingParetoFront()
+    if simulationCount > 0: printDelaySimulationInfo(simulationCount, workerCount)
+
+
+# Sections as JSON values
+def getDelayStatsInfo(summary):
+    counts = summary['counts']
+    statsInfo = {
+        'activityCount': counts['allDelays'],
+        'delayedActivityCount': counts['allPositiveDelays'],
+        'delayedPercentage': 100 * counts['allPositiveDelays'] / counts['allDelays'],
+        'drivingActivityCount': counts['allDelaysDriving'],
+        'nonDrivingActivityCount': counts['allDelaysNonDriving'],
+        'delayedDrivingActivityCount': counts['allPositiveDelaysDriving'],
+        'delayedNonDrivingActivityCount': counts['allPositiveDelaysNonDriving'],
+        'drivingDelayedPercentage': 100 * counts['allPositiveDelaysDriving'] / counts['allDelaysDriving'],
+        'nonDrivingDelayedPercentage': 100 * counts['allPositiveDelaysNonDriving'] / counts['allDelaysNonDriving'],
+        'positiveDelaySampleSize': summary['sampleSize'],
+    }
+    if 'shardInfos' in summary: statsInfo['shards'] = summary['shardInfos']
+    return statsInfo
+
+def getDelayModelFitInfo(data, summary, bootstrapCount=0, includeRSquared=True, workerCount=None):
+    fitInfo = {
+        'gammaAlpha': data['gammaAlpha'],
+        'gammaBeta': data['gammaBeta'],
+        'meanDelayCoefs': data['muCoef'],
+        'robustnessModel': getRobustnessModelInfo(data['muCoef'], data['gammaAlpha'], data['gammaScale']),
+    }
+    if includeRSquared: fitInfo['gammaRSquared'] = getGammaFitRSquared(data['gammaAlpha'], data['gammaScale'], data['allPositiveDelays'])
+    if bootstrapCount > 0: fitInfo['gammaConfidenceIntervals'] = bootstrapGammaFitFromCounts(*getGammaFitValueCounts(data, summary), bootstrapCount, workerCount=workerCount)
+    return fitInfo
+
+def getRobustnessInfo(data, simulationCount=0, workerCount=None):
+    robustnessInfo = {
+        'model': getRobustnessModelInfo(data['muCoef'], data['gammaAlpha'], data['gammaScale']),
+        'examples': getRobustnessCostExamplesInfo(),
+    }
+    if simulationCount > 0: robustnessInfo['simulation'] = {'scenarioCount': simulationCount, 'examples': getDelaySimulationInfo(simulationCount, workerCount)}
+    return robustnessInfo
+
+def toJsonValue(value):
+    if isinstance(value, np.ndarray): return value.tolist()
+    if isinstance(value, np.generic): return value.item()
+    raise TypeError('Cannot convert {0} to JSON'.format(type(value).__name__))
+
+
+# Read the delays and produce the selected output sections, as text or as a single JSON object on stdout
+def run(durationIndexSize, filePath='./output/delays.json', streaming=None, useCache=True, selectedPlotNames=None, plotsFolder='./data-analysis/plots', workerCount=None, force=False, bootstrapCount=0, progressRuns=saProgressRuns, shardPatterns=None, sections=outputSections, simulationCount=0, asJson=False, includeRSquared=True):
+    # Read and process data
+    if any(section in delaySections for section in sections):
+        data, summary = readDelayData(durationIndexSize, filePath, streaming, useCache, shardPatterns, workerCount)
+    if any(section in fitSections for section in sections):
+        fitDelayModel(data, summary)
 
-run(durationIndexSize=30)
+    # Perform output
+    output = {}
+    if 'stats' in sections:
+        if asJson: output['stats'] = getDelayStatsInfo(summary)
+        else: printDelayStats(summary)
+    if 'fit' in sections:
+        if asJson: output['fit'] = getDelayModelFitInfo(data, summary, bootstrapCount, includeRSquared, workerCount)
+        else: printDelayModelFit(data, summary, bootstrapCount, includeRSquared, workerCount)
+    if 'robustness' in sections:
+        if asJson: output['robustness'] = getRobustnessInfo(data, simulationCount, workerCount)
+        else: printRobustnessInfo(data, simulationCount, workerCount)
+    if 'pareto' in sections:
+        if asJson: output['pareto'] = getParetoFrontComparisons()
+        else: printParetoFrontComparisons()
+    if 'plots' in sections:
+        addSaProgress(data, progressRuns)
+        renderFigures({**summary['delayFigures'], **saFigures}, data, selectedPlotNames, plotsFolder, workerCount, force)
+    if asJson: print(json.dumps(output, indent=2, default=toJsonValue))
+
+# Same output as `run`, reading the activities one batch at a time
+def runStreaming(durationIndexSize, filePath='./output/delays.json', **runArgs):
+    run(durationIndexSize, filePath, streaming=True, **runArgs)
+
+# Same output as `runStreaming` for the delays of several exports together, given as directories or glob patterns. The
+# exports are analysed on a process pool and their statistics merged.
+def runSharded(durationIndexSize, shardPatterns, **runArgs):
+    run(durationIndexSize, shardPatterns=shardPatterns, **runArgs)
+
+
+### Command line
+
+# Options are defined on the subcommands and on the full run alike. Unset options are left out of the parsed arguments
+# and filled in from the defaults, so a subcommand parser never overwrites an option given before the subcommand.
+commandDefaults = {
+    'command': None,
+    'input': './output/delays.json',
+    'shards': None,
+    'streaming': None,
+    'no_cache': False,
+    'workers': None,
+    'json': False,
+    'stats_only': False,
+    'bootstrap': 0,
+    'simulate': 0,
+    'plots': None,
+    'plots_folder': './data-analysis/plots',
+    'force': False,
+    'sa_runs': None,
+}
+
+# Sections of each subcommand; without a subcommand all sections are output
+commandSections = {
+    'stats': ['stats'],
+    'fit': ['fit'],
+    'robustness': ['robustness'],
+    'plots': ['plots'],
+}
+
+def getArgumentParser():
+    inputParser = argparse.ArgumentParser(add_help=False, argument_default=argparse.SUPPRESS)
+    inputParser.add_argument('--input', metavar='PATH', help='delay export to analyse (default: ./output/delays.json)')
+    inputParser.add_argument('--shards', nargs='+', metavar='PATH', help='directories or glob patterns of delay exports to analyse together instead of --input')
+    inputParser.add_argument('--streaming', action=argparse.BooleanOptionalAction, help='analyse the export one batch at a time, building the column cache batch by batch (default: for exports above %d MB)' % (streamingFileSize // (1024 * 1024)))
+    inputParser.add_argument('--no-cache', action='store_true', help='parse the export instead of using the cached delay columns')
+    inputParser.add_argument('--workers', type=int, help='number of processes (default: number of CPUs)')
+    inputParser.add_argument('--json', action='store_true', help='print the output as a single JSON object instead of text')
+
+    fitParser = argparse.ArgumentParser(add_help=False, argument_default=argparse.SUPPRESS)
+    fitParser.add_argument('--bootstrap', type=int, metavar='COUNT', help='number of bootstrap replicates for gamma fit confidence intervals (default: none)')
+
+    robustnessParser = argparse.ArgumentParser(add_help=False, argument_default=argparse.SUPPRESS)
+    robustnessParser.add_argument('--simulate', type=int, metavar='COUNT', help='number of Monte Carlo delay scenarios to simulate the robustness cost examples with (default: none)')
+
+    plotsParser = argparse.ArgumentParser(add_help=False, argument_default=argparse.SUPPRESS)
+    plotsParser.add_argument('--plots', nargs='+', choices=plotNames, metavar='PLOT', help='names of the figures to render (default: all); choose from ' + ', '.join(plotNames))
+    plotsParser.add_argument('--plots-folder', metavar='PATH', help='folder to render the figures to (default: ./data-analysis/plots)')
+    plotsParser.add_argument('--force', action='store_true', help='render figures even if their inputs and code are unchanged')
+    plotsParser.add_argument('--sa-runs', nargs='+', metavar='PATH', help='SA run output folders or summary files to plot the progress of (default: the three 10B thesis runs)')
+
+    parser = argparse.ArgumentParser(description='Analyse delay exports; without a subcommand, all output is produced.', parents=[inputParser, fitParser, robustnessParser, plotsParser], argument_default=argparse.SUPPRESS)
+    parser.add_argument('--stats-only', action='store_true', help='only output the delay counts and fitted parameters, without the R^2 of the gamma fit, so neither matplotlib nor scipy.stats is loaded')
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.add_parser('stats', parents=[inputParser], help='delay counts')
+    subparsers.add_parser('fit', parents=[inputParser, fitParser], help='gamma distribution and mean delay fits')
+    subparsers.add_parser('robustness', parents=[inputParser, robustnessParser], help='robustness cost model and examples')
+    subparsers.add_parser('plots', parents=[inputParser, plotsParser], help='figures')
+    return parser
+
+def runCommand(args):
+    args = {**commandDefaults, **vars(args)}
+    if args['command'] != None: sections = commandSections[args['command']]
+    elif args['stats_only']: sections = ['stats', 'fit']
+    else: sections = outputSections
+    progressRuns = saProgressRuns if args['sa_runs'] == None else [(os.path.basename(os.path.normpath(path)), path) for path in args['sa_runs']]
+    run(durationIndexSize=30, filePath=args['input'], streaming=args['streaming'], useCache=not args['no_cache'], selectedPlotNames=args['plots'], plotsFolder=args['plots_folder'], workerCount=args['workers'], force=args['force'], bootstrapCount=args['bootstrap'], progressRuns=progressRuns, shardPatterns=args['shards'], sections=sections, simulationCount=args['simulate'], asJson=args['json'], includeRSquared=not args['stats_only'])
+
+if __name__ == '__main__':
+    runCommand(getArgumentParser().parse_args())
@@ -0,0 +1,194 @@
+import hashlib
+import json
+import os
+from functools import partial
+from itertools import chain
+import numpy as np
+from cacheFolder import buildCacheFolder, hasCacheArrays, loadCacheArrays, readCacheInfo, saveCacheArrays, writeCacheInfo
+
+
+### Columns
+
+# Delay columns as written per activity by DebugDelaysExporter. Note that the exporter sorts each list separately, so
+# the start, end and duration delays at the same position are not necessarily from the same occurrence.
+delayKeys = ['startDelays', 'endDelays', 'durationDelays']
+
+
+# Flatten the activities of a delay export into one NumPy column per field, with one row per delay
+def flattenActivities(activities):
+    activityCount = len(activities)
+    delayCountByActivity = np.fromiter((len(activity['durationDelays']) for activity in activities), dtype=np.int64, count=activityCount)
+    plannedDurationByActivity = np.fromiter((activity['plannedDuration'] for activity in activities), dtype=np.int32, count=activityCount)
+    isDrivingByActivity = np.fromiter((activity['description'] == 'Drive train' for activity in activities), dtype=bool, count=activityCount)
+    delayCount = int(delayCountByActivity.sum())
+
+    activityIndices = np.repeat(np.arange(activityCount, dtype=np.int32), delayCountByActivity)
+    columns = {
+        'activityIndices': activityIndices,
+        'plannedDurations': plannedDurationByActivity[activityIndices],
+        'isDriving': isDrivingByActivity[activityIndices],
+    }
+    for delayKey in delayKeys:
+        flatDelays = chain.from_iterable(activity[delayKey] for activity in activities)
+        columns[delayKey] = np.fromiter(flatDelays, dtype=np.int32, count=delayCount)
+    return columns
+
+
+# Read a delays.json export into flattened delay columns
+def loadDelayColumns(filePath):
+    with open(filePath, 'r') as readFile:
+        data = json.load(readFile)
+    return flattenActivities(data['activities'])
+
+
+### Streaming
+
+# Yield the activities of a delays.json export one at a time, without parsing the whole document
+def streamActivities(filePath, chunkSize=1 << 20):
+    decoder = json.JSONDecoder()
+    with open(filePath, 'r') as readFile:
+        buffer = ''
+        position = 0
+
+        def readMore():
+            nonlocal buffer, position
+            chunk = readFile.read(chunkSize)
+            if chunk == '': raise ValueError('Unexpected end of file in {0}'.format(filePath))
+            buffer = buffer[position:] + chunk
+            position = 0
+
+        # Skip to the start of the activities array
+        while True:
+            keyIndex = buffer.find('"activities"')
+            arrayIndex = buffer.find('[', keyIndex) if keyIndex != -1 else -1
+            if arrayIndex != -1: break
+            readMore()
+        position = arrayIndex + 1
+
+        # Decode one activity object at a time, dropping consumed text from the buffer
+        while True:
+            while True:
+                while position < len(buffer) and buffer[position] in ' \t\r\n,': position += 1
+                if position < len(buffer): break
+                readMore()
+            if buffer[position] == ']': return
+
+            try:
+                activity, position = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                readMore()
+                continue
+            yield activity
+
+
+# Yield flattened delay columns for batches of at most `batchSize` activities; activity indices are relative to the batch
+def streamDelayColumns(filePath, batchSize=10000):
+    batch = []
+    for activity in streamActivities(filePath):
+        batch.append(activity)
+        if len(batch) >= batchSize:
+            yield flattenActivities(batch)
+            batch = []
+    if len(batch) > 0:
+        yield flattenActivities(batch)
+
+
+### Cache
+
+# Flattened delay columns are cached as one .npy file per column in a folder next to the export, so they can be
+# memory-mapped. The cache is keyed on the size, modification time and SHA-256 hash of the export.
+columnKeys = ['activityIndices', 'plannedDurations', 'isDriving'] + delayKeys
+
+
+def getCacheFolder(filePath):
+    return os.path.splitext(filePath)[0] + '.cache'
+
+
+def hashFile(filePath, chunkSize=1 << 24):
+    fileHash = hashlib.sha256()
+    with open(filePath, 'rb') as readFile:
+        for chunk in iter(lambda: readFile.read(chunkSize), b''):
+            fileHash.update(chunk)
+    return fileHash.hexdigest()
+
+
+# Check whether the cache matches the export; the hash is only computed when the size or modification time changed
+def isCacheValid(filePath, cacheFolder):
+    cacheInfo = readCacheInfo(cacheFolder)
+    if cacheInfo == None: return False
+    if not hasCacheArrays(cacheFolder, columnKeys): return False
+
+    fileStat = os.stat(filePath)
+    if cacheInfo['size'] != fileStat.st_size: return False
+    if cacheInfo['mtime'] == fileStat.st_mtime_ns: return True
+
+    # Export was touched; keep the cache if its contents are unchanged
+    if cacheInfo['sha256'] != hashFile(filePath): return False
+    cacheInfo['mtime'] = fileStat.st_mtime_ns
+    writeCacheInfo(cacheFolder, cacheInfo)
+    return True
+
+
+def writeDelayCache(filePath, cacheFolder, streaming=False):
+    fileStat = os.stat(filePath)
+    cacheInfo = {
+        'source': os.path.basename(filePath),
+        'size': fileStat.st_size,
+        'mtime': fileStat.st_mtime_ns,
+        'sha256': hashFile(filePath),
+    }
+
+    if streaming:
+        buildCacheFolder(cacheFolder, cacheInfo, partial(writeStreamedColumns, filePath))
+    else:
+        columns = loadDelayColumns(filePath)
+        buildCacheFolder(cacheFolder, cacheInfo, partial(saveCacheArrays, {columnKey: columns[columnKey] for columnKey in columnKeys}))
+
+
+# Write the columns batch by batch, so exports larger than memory can be cached
+def writeStreamedColumns(filePath, cacheFolder):
+    columnFiles = {columnKey: open(os.path.join(cacheFolder, columnKey + '.raw'), 'wb') for columnKey in columnKeys}
+    columnDtypes = {}
+    activityOffset = 0
+    try:
+        for columns in streamDelayColumns(filePath):
+            columns['activityIndices'] = columns['activityIndices'] + activityOffset
+            if len(columns['activityIndices']) > 0: activityOffset = columns['activityIndices'][-1] + 1
+            for columnKey in columnKeys:
+                columns[columnKey].tofile(columnFiles[columnKey])
+                columnDtypes[columnKey] = columns[columnKey].dtype
+    finally:
+        for columnFile in columnFiles.values(): columnFile.close()
+
+    # Wrap the raw data in .npy files without loading it
+    for columnKey in columnKeys:
+        rawPath = os.path.join(cacheFolder, columnKey + '.raw')
+        dtype = columnDtypes.get(columnKey, np.dtype(np.int32))
+        rowCount = os.path.getsize(rawPath) // dtype.itemsize
+        column = np.lib.format.open_memmap(os.path.join(cacheFolder, columnKey + '.npy'), mode='w+', dtype=dtype, shape=(rowCount,))
+        if rowCount > 0: column[:] = np.memmap(rawPath, dtype=dtype, mode='r')
+        column.flush()
+        del column
+        os.remove(rawPath)
+
+
+# Split delay columns, like the memory-mapped columns of a cache, into batches of about `batchSize` delays. Batches end
+# at activity boundaries and have activity indices from 0, as the batches of `streamDelayColumns`.
+def batchDelayColumns(columns, batchSize=1000000):
+    activityIndices = columns['activityIndices']
+    batchStart = 0
+    while batchStart < len(activityIndices):
+        batchEnd = min(batchStart + batchSize, len(activityIndices))
+        batchEnd = int(np.searchsorted(activityIndices, activityIndices[batchEnd - 1], side='right'))
+        batch = {columnKey: np.asarray(columns[columnKey][batchStart:batchEnd]) for columnKey in columnKeys}
+        batch['activityIndices'] = batch['activityIndices'] - batch['activityIndices'][0]
+        yield batch
+        batchStart = batchEnd
+
+
+# Read the delay columns of an export as memory-mapped arrays, rebuilding the cache when the export changed
+def loadCachedDelayColumns(filePath, streaming=False):
+    cacheFolder = getCacheFolder(filePath)
+    if not isCacheValid(filePath, cacheFolder):
+        writeDelayCache(filePath, cacheFolder, streaming)
+    return loadCacheArrays(cacheFolder, columnKeys)
@@ -0,0 +1,91 @@
+import numpy as np
+from processPool import mapOnPool, spawnSeeds
+from robustnessCost import gammaDistributionDivisor, getConflictProbsIfDelayed, getGammaParameters, getMeanDelays, meanDelayCoefs
+
+
+# Monte Carlo simulation of delays along driver schedules. A schedule is given as arrays with one entry per activity:
+# driver index, planned duration, waiting time until the next activity (np.inf if there is none), delay probability
+# and conflict cost, with the activities of each driver consecutive and in order. Every activity is delayed with its delay
+# probability by a gamma distributed delay from the robustness model. The delay at the end of an activity is its own
+# delay plus the part of the end delay of the previous activity that the waiting time before it could not absorb. A
+# conflict occurs when the end delay exceeds the waiting time after the activity.
+#
+# The robustness cost in the planner (`DataActivityProcessor`) looks at each pair of consecutive activities on its
+# own, which corresponds to the conflict probabilities without knock-on delays.
+
+
+# Scenarios per chunk are limited so that a chunk has at most this many (scenario, activity) delays
+maxChunkDelayCount = 4000000
+
+
+### Schedules
+
+# Positions of the activities within the chain of their driver, and whether each activity has a previous activity
+def getChainPositions(driverIndices):
+    driverIndices = np.asarray(driverIndices)
+    isChainStart = np.concatenate(([True], driverIndices[1:] != driverIndices[:-1]))
+    chainStarts = np.flatnonzero(isChainStart)
+    chainLengths = np.diff(np.append(chainStarts, len(driverIndices)))
+    return np.arange(len(driverIndices)) - np.repeat(chainStarts, chainLengths), ~isChainStart
+
+
+### Simulation
+
+# Numbers of conflicts per activity in a chunk of scenarios, with and without knock-on delays. Delays are stored per
+# activity over all scenarios and drawn for all activities at once, so the cost per delay does not grow with the
+# number of activities. Knock-on delays are propagated for all drivers at once, one chain position at a time.
+def simulateConflictCounts(schedule, scenarioCount, seed):
+    random = np.random.default_rng(seed)
+    activityCount = len(schedule['plannedDurations'])
+    waitingTimes = schedule['waitingTimes'][:, np.newaxis]
+
+    isDelayed = random.random((activityCount, scenarioCount)) < schedule['delayProbs'][:, np.newaxis]
+    delayedIndices = np.nonzero(isDelayed)
+    delays = np.zeros((activityCount, scenarioCount))
+    delays[delayedIndices] = random.standard_gamma(schedule['alphas'][delayedIndices[0]]) / schedule['betas'][delayedIndices[0]]
+    independentConflictCounts = np.count_nonzero(delays > waitingTimes, axis=1)
+
+    endDelays = delays
+    chainPositions, hasPrevious = schedule['chainPositions'], schedule['hasPrevious']
+    for chainPosition in range(1, int(chainPositions.max(initial=0)) + 1):
+        activityIndices = np.flatnonzero((chainPositions == chainPosition) & hasPrevious)
+        endDelays[activityIndices] += np.maximum(endDelays[activityIndices - 1] - waitingTimes[activityIndices - 1], 0)
+    propagatedConflictCounts = np.count_nonzero(endDelays > waitingTimes, axis=1)
+    return independentConflictCounts, propagatedConflictCounts
+
+
+# Empirical conflict probabilities and robustness costs of a schedule next to the analytic robustness cost model.
+# Scenarios are simulated in chunks on a process pool, with the schedule sent to each worker once.
+def simulateSchedule(driverIndices, plannedDurations, waitingTimes, delayProbs, conflictCosts, scenarioCount=1000000, seed=0, workerCount=None, chunkSize=None, meanDelayCoefs=meanDelayCoefs, gammaDistributionDivisor=gammaDistributionDivisor):
+    plannedDurations = np.asarray(plannedDurations, dtype=float)
+    waitingTimes = np.asarray(waitingTimes, dtype=float)
+    alphas, betas = getGammaParameters(getMeanDelays(plannedDurations, meanDelayCoefs), gammaDistributionDivisor)
+    chainPositions, hasPrevious = getChainPositions(driverIndices)
+    schedule = {
+        'plannedDurations': plannedDurations,
+        'waitingTimes': waitingTimes,
+        'delayProbs': np.asarray(delayProbs, dtype=float),
+        'alphas': alphas,
+        'betas': betas,
+        'chainPositions': chainPositions,
+        'hasPrevious': hasPrevious,
+    }
+
+    if chunkSize == None: chunkSize = max(maxChunkDelayCount // max(len(plannedDurations), 1), 1)
+    chunkScenarioCounts = [min(chunkSize, scenarioCount - chunkStart) for chunkStart in range(0, scenarioCount, chunkSize)]
+    chunkCounts = mapOnPool(simulateConflictCounts, [chunkScenarioCounts, spawnSeeds(seed, len(chunkScenarioCounts))], workerCount, (schedule,))
+    independentConflictCounts, propagatedConflictCounts = (np.sum(counts, axis=0) for counts in zip(*chunkCounts))
+
+    conflictCosts = np.asarray(conflictCosts, dtype=float)
+    independentConflictProbs = independentConflictCounts / scenarioCount
+    propagatedConflictProbs = propagatedConflictCounts / scenarioCount
+    analyticConflictProbs = schedule['delayProbs'] * getConflictProbsIfDelayed(plannedDurations, waitingTimes, meanDelayCoefs, gammaDistributionDivisor)
+    return {
+        'scenarioCount': scenarioCount,
+        'analyticConflictProbs': analyticConflictProbs,
+        'analyticRobustnessCosts': analyticConflictProbs * conflictCosts,
+        'independentConflictProbs': independentConflictProbs,
+        'propagatedConflictProbs': propagatedConflictProbs,
+        'propagatedConflictProbStds': np.sqrt(propagatedConflictProbs * (1 - propagatedConflictProbs) / scenarioCount),
+        'propagatedRobustnessCosts': propagatedConflictProbs * conflictCosts,
+    }
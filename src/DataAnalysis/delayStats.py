@@ -0,0 +1,115 @@
+import numpy as np
+from durationStats import computeMoments, createMoments, mergeMoments
+from gammaFit import computeGammaStats, createGammaStats, mergeGammaStats
+from histograms import computeBinCounts, getBinCount, seriesBins
+
+
+# Largest counts of values for which numpy draws from a hypergeometric distribution
+maxHypergeometricCount = 1000000000
+
+
+### Streaming statistics
+
+# Delay statistics built up batch by batch with memory independent of the number of delays. Statistics of separate
+# exports can be combined with `merge`; activities with at least 5 positive delays are then determined per export.
+class StreamingDelayStats:
+    def __init__(self, gammaFitMaxDelay=600, reservoirSize=100000, seed=0):
+        self.gammaFitMaxDelay = gammaFitMaxDelay
+        self.reservoirSize = reservoirSize
+        self.random = np.random.default_rng(seed)
+
+        self.counts = {seriesName: 0 for seriesName in seriesBins}
+        self.binCounts = {seriesName: np.zeros(getBinCount(bins), dtype=np.int64) for seriesName, bins in seriesBins.items()}
+
+        # Positive delays by exact planned duration
+        self.positiveMomentsByPlannedDuration = createMoments()
+
+        # Positive delays of activities with at least 5 positive delays, by exact planned duration
+        self.frequentMomentsByPlannedDuration = createMoments()
+
+        # Gamma distribution sufficient statistics and value counts of the positive delays below `gammaFitMaxDelay`
+        self.positiveGammaStats = createGammaStats()
+        self.positiveValueCounts = np.zeros(gammaFitMaxDelay, dtype=np.int64)
+
+        # Uniform sample of all positive delays
+        self.positiveSample = np.zeros(reservoirSize, dtype=np.int32)
+        self.positiveSeenCount = 0
+
+    def add(self, columns):
+        allDelays = columns['durationDelays']
+        plannedDurations = columns['plannedDurations']
+        activityIndices = columns['activityIndices']
+        isDriving = columns['isDriving']
+        isPositive = allDelays > 0
+
+        seriesMasks = {
+            'allDelays': None,
+            'allDelaysDriving': isDriving,
+            'allDelaysNonDriving': ~isDriving,
+            'allPositiveDelays': isPositive,
+            'allPositiveDelaysDriving': isPositive & isDriving,
+            'allPositiveDelaysNonDriving': isPositive & ~isDriving,
+        }
+        for seriesName, mask in seriesMasks.items():
+            values = allDelays if mask is None else allDelays[mask]
+            self.counts[seriesName] += len(values)
+            self.binCounts[seriesName] += computeBinCounts(values, seriesBins[seriesName])
+
+        positiveDelays = allDelays[isPositive]
+        self.positiveMomentsByPlannedDuration = mergeMoments(self.positiveMomentsByPlannedDuration, computeMoments(plannedDurations[isPositive], positiveDelays))
+
+        activityCount = activityIndices[-1] + 1 if len(activityIndices) > 0 else 0
+        positiveCountByActivity = np.bincount(activityIndices[isPositive], minlength=activityCount)
+        isFrequent = isPositive & (positiveCountByActivity[activityIndices] >= 5)
+        self.frequentMomentsByPlannedDuration = mergeMoments(self.frequentMomentsByPlannedDuration, computeMoments(plannedDurations[isFrequent], allDelays[isFrequent]))
+
+        gammaFitDelays = positiveDelays[positiveDelays < self.gammaFitMaxDelay]
+        self.positiveGammaStats = mergeGammaStats(self.positiveGammaStats, computeGammaStats(gammaFitDelays))
+        self.positiveValueCounts += np.bincount(gammaFitDelays, minlength=self.gammaFitMaxDelay)
+        self.addToSample(positiveDelays)
+
+    # Reservoir sampling (algorithm R) for a batch of values
+    def addToSample(self, values):
+        fillCount = min(max(self.reservoirSize - self.positiveSeenCount, 0), len(values))
+        self.positiveSample[self.positiveSeenCount:self.positiveSeenCount + fillCount] = values[:fillCount]
+
+        seenCounts = self.positiveSeenCount + np.arange(fillCount, len(values)) + 1
+        sampleIndices = (self.random.random(len(seenCounts)) * seenCounts).astype(np.int64)
+        isReplaced = sampleIndices < self.reservoirSize
+        # For repeated indices the last assignment wins, as with sequential replacement
+        self.positiveSample[sampleIndices[isReplaced]] = values[fillCount:][isReplaced]
+        self.positiveSeenCount += len(values)
+
+    # Add the statistics of another set of delays
+    def merge(self, other):
+        for seriesName in self.counts:
+            self.counts[seriesName] += other.counts[seriesName]
+            self.binCounts[seriesName] += other.binCounts[seriesName]
+        self.positiveMomentsByPlannedDuration = mergeMoments(self.positiveMomentsByPlannedDuration, other.positiveMomentsByPlannedDuration)
+        self.frequentMomentsByPlannedDuration = mergeMoments(self.frequentMomentsByPlannedDuration, other.frequentMomentsByPlannedDuration)
+        self.positiveGammaStats = mergeGammaStats(self.positiveGammaStats, other.positiveGammaStats)
+        self.positiveValueCounts += other.positiveValueCounts
+        self.mergeSample(other)
+
+    # Combine two reservoir samples into a uniform sample of both sets of values, by drawing the number of values to
+    # take from this sample from a hypergeometric distribution. numpy only draws those for counts below
+    # `maxHypergeometricCount`; above that the reservoir is a tiny share of the values, so a binomial draw is used.
+    def mergeSample(self, other):
+        sample, otherSample = self.getPositiveSample(), other.getPositiveSample()
+        seenCount = self.positiveSeenCount + other.positiveSeenCount
+        if seenCount <= self.reservoirSize:
+            mergedSample = np.concatenate((sample, otherSample))
+        else:
+            if max(self.positiveSeenCount, other.positiveSeenCount) < maxHypergeometricCount:
+                takeCount = self.random.hypergeometric(self.positiveSeenCount, other.positiveSeenCount, self.reservoirSize) if other.positiveSeenCount > 0 else self.reservoirSize
+            else:
+                takeCount = self.random.binomial(self.reservoirSize, self.positiveSeenCount / seenCount)
+            takeCount = min(max(takeCount, self.reservoirSize - len(otherSample)), len(sample))
+            takenValues = self.random.choice(sample, takeCount, replace=False)
+            otherTakenValues = self.random.choice(otherSample, self.reservoirSize - takeCount, replace=False)
+            mergedSample = np.concatenate((takenValues, otherTakenValues))
+        self.positiveSample[:len(mergedSample)] = mergedSample
+        self.positiveSeenCount = seenCount
+
+    def getPositiveSample(self):
+        return self.positiveSample[:min(self.positiveSeenCount, self.reservoirSize)]
@@ -0,0 +1,81 @@
+import numpy as np
+
+
+# Moments of groups of values, as arrays of count, mean and sum of squared differences from the mean (M2) indexed by
+# group. Delays are grouped by exact planned duration, so buckets of any `durationIndexSize` can be derived afterwards
+# with `regroupMoments`. Moments of separate batches, file shards or worker processes are combined with `mergeMoments`,
+# using the parallel form of Welford's algorithm by Chan et al.
+
+
+### Moments
+
+def createMoments(groupCount=0):
+    return {
+        'counts': np.zeros(groupCount, dtype=np.int64),
+        'means': np.zeros(groupCount),
+        'm2s': np.zeros(groupCount),
+    }
+
+
+def padMoments(moments, groupCount):
+    extraCount = groupCount - len(moments['counts'])
+    if extraCount <= 0: return moments
+    return {key: np.concatenate((values, np.zeros(extraCount, dtype=values.dtype))) for key, values in moments.items()}
+
+
+# Moments of values per group index, with the means subtracted before squaring to keep M2 accurate
+def computeMoments(groupIndices, values, groupCount=None):
+    groupIndices = np.asarray(groupIndices, dtype=np.int64)
+    values = np.asarray(values, dtype=float)
+    if groupCount == None: groupCount = int(groupIndices.max()) + 1 if len(groupIndices) > 0 else 0
+
+    counts = np.bincount(groupIndices, minlength=groupCount)
+    sums = np.bincount(groupIndices, weights=values, minlength=groupCount)
+    means = np.divide(sums, counts, out=np.zeros(groupCount), where=counts > 0)
+    m2s = np.bincount(groupIndices, weights=(values - means[groupIndices]) ** 2, minlength=groupCount)
+    return {'counts': counts, 'means': means, 'm2s': m2s}
+
+
+# Combine the moments of the same groups from two sets of values
+def mergeMoments(moments1, moments2):
+    groupCount = max(len(moments1['counts']), len(moments2['counts']))
+    moments1 = padMoments(moments1, groupCount)
+    moments2 = padMoments(moments2, groupCount)
+
+    counts1, counts2 = moments1['counts'], moments2['counts']
+    counts = counts1 + counts2
+    safeCounts = np.maximum(counts, 1)
+    deltas = moments2['means'] - moments1['means']
+    return {
+        'counts': counts,
+        'means': moments1['means'] + deltas * counts2 / safeCounts,
+        'm2s': moments1['m2s'] + moments2['m2s'] + deltas * deltas * counts1 * counts2 / safeCounts,
+    }
+
+
+# Combine groups into buckets of `groupSize` consecutive group indices
+def regroupMoments(moments, groupSize):
+    bucketIndices = np.arange(len(moments['counts'])) // groupSize
+    bucketCount = bucketIndices[-1] + 1 if len(bucketIndices) > 0 else 0
+    weightedSums = moments['counts'] * moments['means']
+
+    counts = np.bincount(bucketIndices, weights=moments['counts'], minlength=bucketCount).astype(np.int64)
+    sums = np.bincount(bucketIndices, weights=weightedSums, minlength=bucketCount)
+    means = np.divide(sums, counts, out=np.zeros(bucketCount), where=counts > 0)
+    deltas = moments['means'] - means[bucketIndices]
+    m2s = np.bincount(bucketIndices, weights=moments['m2s'] + moments['counts'] * deltas * deltas, minlength=bucketCount)
+    return {'counts': counts, 'means': means, 'm2s': m2s}
+
+
+### Statistics
+
+# Population standard deviation per group, as returned by `stats.norm.fit`
+def getMomentsStds(moments):
+    return np.sqrt(moments['m2s'] / np.maximum(moments['counts'], 1))
+
+
+# Least squares polynomial fit of the values by group index. Fitting the group means with weights of the square root
+# of their counts gives the same coefficients as fitting all individual values.
+def fitPolynomialToMoments(moments, degree, minCount=1):
+    hasValues = moments['counts'] >= max(minCount, 1)
+    return np.polyfit(np.flatnonzero(hasValues), moments['means'][hasValues], degree, w=np.sqrt(moments['counts'][hasValues]))
@@ -0,0 +1,90 @@
+import numpy as np
+from processPool import mapOnPool, spawnSeeds
+
+
+### Sufficient statistics
+
+# The maximum likelihood fit of a gamma distribution with location 0 only depends on the number of values, their sum
+# and the sum of their logarithms. These can be computed per chunk or stream and merged by adding them up.
+def computeGammaStats(values):
+    values = np.asarray(values, dtype=float)
+    if np.any(values <= 0): raise ValueError('Gamma distribution values must be positive')
+    return {
+        'count': len(values),
+        'sum': float(values.sum()),
+        'logSum': float(np.log(values).sum()),
+    }
+
+
+def createGammaStats():
+    return {'count': 0, 'sum': 0.0, 'logSum': 0.0}
+
+
+def mergeGammaStats(*gammaStatsList):
+    mergedStats = createGammaStats()
+    for gammaStats in gammaStatsList:
+        for key in mergedStats: mergedStats[key] += gammaStats[key]
+    return mergedStats
+
+
+### Fitting
+
+# Solve log(alpha) - digamma(alpha) = log(mean) - mean(log x) with Newton's method, starting from the approximation
+# by Minka (2002), and return the shape alpha and rate beta
+def fitGammaFromStats(gammaStats, tolerance=1e-12, maxIterationCount=100):
+    from scipy.special import digamma, polygamma
+    count = gammaStats['count']
+    if count < 2: raise ValueError('At least 2 values are needed to fit a gamma distribution')
+    mean = gammaStats['sum'] / count
+    logMeanDiff = np.log(mean) - gammaStats['logSum'] / count
+    if logMeanDiff <= 0: raise ValueError('Gamma distribution cannot be fitted to values that are all equal')
+
+    alpha = (3 - logMeanDiff + np.sqrt((logMeanDiff - 3) ** 2 + 24 * logMeanDiff)) / (12 * logMeanDiff)
+    for _ in range(maxIterationCount):
+        step = (np.log(alpha) - digamma(alpha) - logMeanDiff) / (1 / alpha - polygamma(1, alpha))
+        alpha = max(alpha - step, alpha / 10) # Guard against overshooting to a negative alpha
+        if abs(step) <= tolerance * alpha: break
+    return float(alpha), float(alpha / mean)
+
+
+def fitGamma(values):
+    return fitGammaFromStats(computeGammaStats(values))
+
+
+### Bootstrap
+
+# Bootstrap replicates only need the sufficient statistics of a resample. Values are grouped by unique value, so a
+# resample is a multinomial draw of counts per unique value, which keeps replicates cheap for integer delays.
+def fitBootstrapReplicates(uniqueValues, probs, replicateCount, count, seed):
+    random = np.random.default_rng(seed)
+    logUniqueValues = np.log(uniqueValues)
+    fits = np.empty((replicateCount, 2))
+    for replicateIndex in range(replicateCount):
+        resampleCounts = random.multinomial(count, probs)
+        gammaStats = {'count': count, 'sum': resampleCounts @ uniqueValues, 'logSum': resampleCounts @ logUniqueValues}
+        fits[replicateIndex] = fitGammaFromStats(gammaStats)
+    return fits
+
+
+def bootstrapGammaFit(values, replicateCount=1000, confidenceLevel=0.95, seed=0, workerCount=None):
+    uniqueValues, uniqueCounts = np.unique(values, return_counts=True)
+    return bootstrapGammaFitFromCounts(uniqueValues, uniqueCounts, replicateCount, confidenceLevel, seed, workerCount)
+
+
+# Percentile bootstrap confidence intervals of alpha and beta, with the replicates split in chunks over a process pool
+def bootstrapGammaFitFromCounts(uniqueValues, uniqueCounts, replicateCount=1000, confidenceLevel=0.95, seed=0, workerCount=None, chunkSize=100):
+    uniqueValues = np.asarray(uniqueValues, dtype=float)
+    count = int(np.sum(uniqueCounts))
+    probs = np.asarray(uniqueCounts) / count
+
+    chunkReplicateCounts = [min(chunkSize, replicateCount - chunkStart) for chunkStart in range(0, replicateCount, chunkSize)]
+    chunkSeeds = spawnSeeds(seed, len(chunkReplicateCounts))
+    chunkFits = mapOnPool(fitBootstrapReplicates, [chunkReplicateCounts, [count] * len(chunkSeeds), chunkSeeds], workerCount, (uniqueValues, probs))
+    fits = np.concatenate(chunkFits)
+
+    tailShare = (1 - confidenceLevel) / 2
+    alphaInterval, betaInterval = np.quantile(fits, [tailShare, 1 - tailShare], axis=0).T
+    return {
+        'alpha': (float(alphaInterval[0]), float(alphaInterval[1])),
+        'beta': (float(betaInterval[0]), float(betaInterval[1])),
+    }
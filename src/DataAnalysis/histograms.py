@@ -0,0 +1,90 @@
+import numpy as np
+
+
+### Bins
+
+# Histogram bins used by the delay plots, as (binMin, binMax, binSize)
+delayBins = (-300, 300, 10)
+positiveDelayBins = (0, 300, 5)
+
+# Delay series that are plotted as histograms, with their bins
+seriesBins = {
+    'allDelays': delayBins,
+    'allDelaysDriving': delayBins,
+    'allDelaysNonDriving': delayBins,
+    'allPositiveDelays': positiveDelayBins,
+    'allPositiveDelaysDriving': positiveDelayBins,
+    'allPositiveDelaysNonDriving': positiveDelayBins,
+}
+
+
+def getBinEdges(bins):
+    binMin, binMax, binSize = bins
+    return np.arange(binMin, binMax + binSize, binSize)
+
+
+def getBinCount(bins):
+    return len(getBinEdges(bins)) - 1
+
+
+# Number of values per bin, with the same edge handling as `np.histogram`: values outside the bins are left out and
+# the last bin includes its upper edge. Bins are assigned arithmetically and counted with a single `np.bincount`.
+def computeBinCounts(values, bins):
+    binMin, _, binSize = bins
+    binCount = getBinCount(bins)
+    binEdges = getBinEdges(bins)
+    if np.issubdtype(values.dtype, np.integer):
+        binIndices = (values.astype(np.int64) - binMin) // binSize
+    else:
+        binIndices = np.floor((values - binMin) / binSize).astype(np.int64)
+    binIndices[values == binEdges[-1]] = binCount - 1
+    isInBins = (binIndices >= 0) & (binIndices < binCount)
+    return np.bincount(binIndices[isInBins], minlength=binCount)
+
+
+### Histograms
+
+# Bin counts divided by the total number of values, including those outside the bins, as plotted by `plt.hist` with
+# weights of 1 / count
+def computeHistogram(values, bins):
+    return computeBinCounts(values, bins) / max(len(values), 1)
+
+
+def getHistogramKey(seriesName):
+    return seriesName + 'Histogram'
+
+
+# Add the normalized histogram of each plotted series to the render data, so every figure that shows a series reuses
+# the same bin counts instead of binning the raw values again
+def addHistograms(data):
+    for seriesName, bins in seriesBins.items():
+        if seriesName in data: data[getHistogramKey(seriesName)] = computeHistogram(data[seriesName], bins)
+
+
+def addHistogramsFromBinCounts(data, binCountsBySeries, countsBySeries):
+    for seriesName in seriesBins:
+        data[getHistogramKey(seriesName)] = binCountsBySeries[seriesName] / max(countsBySeries[seriesName], 1)
+
+
+### Plotting
+
+def plotHistogram(ax, data, seriesName, ylim=None, color=(0, 0.5, 1, 1), alpha=1, histtype='bar'):
+    from matplotlib.ticker import PercentFormatter
+    bins = seriesBins[seriesName]
+    binMin, binMax, _ = bins
+    fill = histtype in ['bar', 'stepfilled']
+    ax.stairs(data[getHistogramKey(seriesName)], getBinEdges(bins), fill=fill, color=color, alpha=alpha)
+    ax.set_xlim([binMin, binMax])
+    ax.yaxis.set_major_formatter(PercentFormatter(1)) # Show percentagess
+    if ylim != None: ax.set_ylim(ylim)
+
+# Share of a distribution per bin of `binSize / precision`, scaled up by `precision` to match the histogram bins
+def plotDistribution(ax, cdfFunc, binMin=-600, binMax=600, binSize=30, ylim=None, color=(0, 0.5, 1, 1), lineWidth=1, precision=10):
+    binCount = int((binMax - binMin) / binSize) * precision
+
+    cdf = precision * cdfFunc(np.linspace(binMin, binMax, binCount + 2))
+    groupedCdf = np.diff(cdf)
+
+    x2 = np.linspace(binMin, binMax, binCount + 1)
+    ax.plot(x2, groupedCdf, color=color, linewidth=lineWidth)
+    if ylim != None: ax.set_ylim(ylim)
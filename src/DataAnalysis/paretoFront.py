@@ -0,0 +1,139 @@
+import json
+import os
+import numpy as np
+from processPool import mapOnPool
+
+
+# Solutions and Pareto fronts are (costs, satisfactions) tuples of arrays, with satisfaction as a percentage. Cost is
+# minimized and satisfaction maximized. The front of several sets of solutions is the front of their fronts, so
+# archives can be reduced one by one or in parallel and merged with `mergeParetoFronts`.
+
+
+### Fronts
+
+# Indices of the non-dominated solutions, by increasing cost. Solutions are swept by increasing cost in groups of
+# equal cost; the first solution with the highest satisfaction of a group is on the front if that satisfaction exceeds
+# the satisfaction of all cheaper solutions. Only the single sort by cost is O(n log n).
+def getNonDominatedIndices(costs, satisfactions):
+    costs = np.asarray(costs, dtype=float)
+    satisfactions = np.asarray(satisfactions, dtype=float)
+    if len(costs) == 0: return np.zeros(0, dtype=np.int64)
+
+    sortedIndices = np.argsort(costs)
+    sortedCosts = costs[sortedIndices]
+    sortedSatisfactions = satisfactions[sortedIndices]
+    groupStarts = np.flatnonzero(np.concatenate(([True], sortedCosts[1:] != sortedCosts[:-1])))
+    groupMaxSatisfactions = np.maximum.reduceat(sortedSatisfactions, groupStarts)
+    prevMaxSatisfactions = np.maximum.accumulate(np.concatenate(([-np.inf], groupMaxSatisfactions[:-1])))
+    isFrontGroup = groupMaxSatisfactions > prevMaxSatisfactions
+
+    groupIndices = np.repeat(np.arange(len(groupStarts)), np.diff(np.append(groupStarts, len(costs))))
+    isGroupMax = isFrontGroup[groupIndices] & (sortedSatisfactions == groupMaxSatisfactions[groupIndices])
+    maxPositions = np.flatnonzero(isGroupMax)
+    firstMaxPositions = maxPositions[np.concatenate(([True], groupIndices[maxPositions[1:]] != groupIndices[maxPositions[:-1]]))] if len(maxPositions) > 0 else maxPositions
+    return sortedIndices[firstMaxPositions]
+
+
+def getParetoFront(costs, satisfactions):
+    costs = np.asarray(costs, dtype=float)
+    satisfactions = np.asarray(satisfactions, dtype=float)
+    frontIndices = getNonDominatedIndices(costs, satisfactions)
+    return costs[frontIndices], satisfactions[frontIndices]
+
+
+def mergeParetoFronts(*fronts):
+    return getParetoFront(np.concatenate([front[0] for front in fronts]), np.concatenate([front[1] for front in fronts]))
+
+
+### Archives
+
+# Solutions of an archive: the Pareto front schedules in the run.json of an SA run output folder, an .npy file of
+# (cost, satisfaction) rows, or a text file of comma-separated cost and satisfaction per line
+def loadSolutionArchive(filePath):
+    if os.path.isdir(filePath): filePath = os.path.join(filePath, 'run.json')
+    if os.path.basename(filePath) == 'run.json':
+        with open(filePath) as file:
+            schedules = json.load(file)['schedules']
+        costs = np.array([schedule['cost'] for schedule in schedules], dtype=float)
+        satisfactions = np.array([schedule['satisfaction'] * 100 for schedule in schedules], dtype=float)
+        return costs, satisfactions
+
+    if filePath.endswith('.npy'):
+        solutions = np.load(filePath, mmap_mode='r')
+    else:
+        with open(filePath) as file:
+            hasHeader = any(char.isalpha() for char in file.readline())
+        solutions = np.loadtxt(filePath, delimiter=',', skiprows=1 if hasHeader else 0, ndmin=2)
+    return np.asarray(solutions[:, 0], dtype=float), np.asarray(solutions[:, 1], dtype=float)
+
+
+def getArchiveParetoFront(filePath):
+    return getParetoFront(*loadSolutionArchive(filePath))
+
+
+# Pareto front of all solutions in a list of archives, with the archives reduced to their fronts on a process pool
+def getCombinedParetoFront(filePaths, workerCount=None):
+    return mergeParetoFronts(*mapOnPool(getArchiveParetoFront, [filePaths], workerCount))
+
+
+### Metrics
+
+# Cost and satisfaction ranges of a set of fronts, as the ideal point (min cost, max satisfaction) and nadir point
+# (max cost, min satisfaction)
+def getFrontBounds(*fronts):
+    costs = np.concatenate([front[0] for front in fronts])
+    satisfactions = np.concatenate([front[1] for front in fronts])
+    return (costs.min(), satisfactions.max()), (costs.max(), satisfactions.min())
+
+
+# Front as points to minimize, scaled so that the ideal point is (0, 0) and the nadir point (1, 1)
+def normalizeFront(front, bounds):
+    (idealCost, idealSatisfaction), (nadirCost, nadirSatisfaction) = bounds
+    costRange = max(nadirCost - idealCost, 1e-12)
+    satisfactionRange = max(idealSatisfaction - nadirSatisfaction, 1e-12)
+    return np.column_stack(((np.asarray(front[0]) - idealCost) / costRange, (idealSatisfaction - np.asarray(front[1])) / satisfactionRange))
+
+
+# Area dominated by normalized points and bounded by the reference point
+def getHypervolume(points, referencePoint=(1.1, 1.1)):
+    points = points[(points[:, 0] < referencePoint[0]) & (points[:, 1] < referencePoint[1])]
+    points = points[getNonDominatedIndices(points[:, 0], -points[:, 1])]
+    prevSecondObjectives = np.concatenate(([referencePoint[1]], points[:-1, 1]))
+    return float(np.sum((referencePoint[0] - points[:, 0]) * (prevSecondObjectives - points[:, 1])))
+
+
+# Mean Euclidean distance from each normalized point to the nearest point of the other front. From a front to the
+# reference front this is the generational distance (GD), the other way around the inverted generational distance.
+def getMeanNearestDistance(points, otherPoints):
+    from scipy.spatial import cKDTree
+    distances, _ = cKDTree(otherPoints).query(points)
+    return float(distances.mean())
+
+
+# Additive epsilon indicator: the smallest shift of the normalized front towards the ideal point for which it weakly
+# dominates every point of the reference front
+def getAdditiveEpsilon(points, referencePoints, chunkSize=1024):
+    epsilon = -np.inf
+    for chunkStart in range(0, len(referencePoints), chunkSize):
+        chunkPoints = referencePoints[chunkStart:chunkStart + chunkSize]
+        shifts = np.max(points[:, np.newaxis, :] - chunkPoints[np.newaxis, :, :], axis=2)
+        epsilon = max(epsilon, float(shifts.min(axis=0).max()))
+    return epsilon
+
+
+# Quality of a front compared to a reference front, for example a 4B-iteration front against a 10B-iteration front.
+# Metrics are computed on objectives normalized over both fronts.
+def compareParetoFronts(front, referenceFront):
+    bounds = getFrontBounds(front, referenceFront)
+    points = normalizeFront(front, bounds)
+    referencePoints = normalizeFront(referenceFront, bounds)
+    hypervolume = getHypervolume(points)
+    referenceHypervolume = getHypervolume(referencePoints)
+    return {
+        'hypervolume': hypervolume,
+        'referenceHypervolume': referenceHypervolume,
+        'hypervolumeRatio': hypervolume / referenceHypervolume if referenceHypervolume > 0 else np.nan,
+        'generationalDistance': getMeanNearestDistance(points, referencePoints),
+        'invertedGenerationalDistance': getMeanNearestDistance(referencePoints, points),
+        'additiveEpsilon': getAdditiveEpsilon(points, referencePoints),
+    }
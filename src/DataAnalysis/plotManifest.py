@@ -0,0 +1,120 @@
+import hashlib
+import inspect
+import json
+import os
+import types
+from functools import partial
+import numpy as np
+
+
+# Fingerprints of rendered figures are stored per plot name in a manifest file in the plots folder. A figure is only
+# rendered again when the fingerprint of its input data, parameters or code changes.
+manifestFileName = 'manifest.json'
+
+# Code of figures is followed into the modules in this folder, where the plotting helpers live
+projectFolder = os.path.dirname(os.path.abspath(__file__))
+
+
+### Hashing
+
+# Add a value to a hash; arrays are hashed by their raw data, containers recursively
+def hashValue(valueHash, value):
+    if isinstance(value, np.ndarray):
+        valueHash.update('ndarray {0} {1};'.format(value.dtype.str, value.shape).encode())
+        valueHash.update(memoryview(np.ascontiguousarray(value)).cast('B'))
+    elif isinstance(value, dict):
+        valueHash.update('dict {0};'.format(len(value)).encode())
+        for key in sorted(value, key=str):
+            hashValue(valueHash, key)
+            hashValue(valueHash, value[key])
+    elif isinstance(value, (list, tuple)):
+        valueHash.update('{0} {1};'.format(type(value).__name__, len(value)).encode())
+        for item in value: hashValue(valueHash, item)
+    elif isinstance(value, np.random.Generator):
+        pass # Random state does not affect the figure
+    elif isinstance(value, (str, bytes, int, float, complex, bool, np.generic)) or value is None:
+        valueHash.update('{0} {1!r};'.format(type(value).__name__, value).encode())
+    else:
+        valueHash.update('object {0};'.format(type(value).__name__).encode())
+        hashValue(valueHash, vars(value))
+
+
+def getValueFingerprint(value):
+    valueHash = hashlib.sha256()
+    hashValue(valueHash, value)
+    return valueHash.hexdigest()
+
+
+# Whether a function or partial is defined in a module in the project folder
+def isProjectFunction(function):
+    if isinstance(function, partial): function = function.func
+    code = getattr(function, '__code__', None)
+    return code != None and os.path.dirname(os.path.abspath(code.co_filename)) == projectFolder
+
+
+# Add the source of a function to a hash, followed by the project functions and the data globals it refers to. Data
+# globals of other modules are included through the functions of those modules that refer to them.
+def hashCode(codeHash, function, visitedFunctions):
+    if isinstance(function, partial):
+        hashValue(codeHash, (function.args, function.keywords))
+        function = function.func
+    if function in visitedFunctions: return
+    visitedFunctions.add(function)
+    codeHash.update(inspect.getsource(function).encode())
+
+    moduleGlobals = function.__globals__
+    for name in sorted(getReferencedNames(function.__code__)):
+        if name not in moduleGlobals: continue
+        value = moduleGlobals[name]
+        if isinstance(value, (types.FunctionType, partial)):
+            if isProjectFunction(value): hashCode(codeHash, value, visitedFunctions)
+        elif not isinstance(value, (types.ModuleType, type)) and not callable(value):
+            hashValue(codeHash, name)
+            hashValue(codeHash, value)
+
+
+# Global names used by a code object, including those of nested functions and lambdas
+def getReferencedNames(code):
+    names = set(code.co_names)
+    for constant in code.co_consts:
+        if isinstance(constant, types.CodeType): names |= getReferencedNames(constant)
+    return names
+
+
+def getCodeFingerprint(*functions):
+    import matplotlib
+    codeHash = hashlib.sha256()
+    codeHash.update('matplotlib {0};'.format(matplotlib.__version__).encode())
+    visitedFunctions = set()
+    for function in functions:
+        hashCode(codeHash, function, visitedFunctions)
+    return codeHash.hexdigest()
+
+
+### Manifest
+
+def readManifest(plotsFolder):
+    try:
+        with open(os.path.join(plotsFolder, manifestFileName), 'r') as readFile:
+            return json.load(readFile)
+    except (OSError, ValueError):
+        return {}
+
+
+def writeManifest(plotsFolder, manifest):
+    filePath = os.path.join(plotsFolder, manifestFileName)
+    with open(filePath + '.tmp', 'w') as writeFile:
+        json.dump(manifest, writeFile, indent=2, sort_keys=True)
+    os.replace(filePath + '.tmp', filePath)
+
+
+# Fingerprint of a figure from its code, the code that saves it, like the savefig arguments, and the values of its input
+# keys in the render data
+def getFigureFingerprint(function, inputKeys, data, inputFingerprints, saveFunction=None):
+    figureHash = hashlib.sha256()
+    codeFunctions = [function] if saveFunction == None else [function, saveFunction]
+    figureHash.update(getCodeFingerprint(*codeFunctions).encode())
+    for inputKey in inputKeys:
+        if inputKey not in inputFingerprints: inputFingerprints[inputKey] = getValueFingerprint(data.get(inputKey))
+        figureHash.update('{0}={1};'.format(inputKey, inputFingerprints[inputKey]).encode())
+    return figureHash.hexdigest()
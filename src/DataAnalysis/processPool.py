@@ -0,0 +1,44 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import numpy as np
+
+
+# Independent tasks are mapped over a process pool, or run in this process for a single worker. Inputs shared by all
+# tasks are handed to each worker once through the pool initializer (inherited without copying when processes are
+# forked), rather than pickled per task.
+
+
+### Seeds
+
+# Seeds for a number of tasks from a single seed. Every task gets its own seed, so results do not depend on the
+# number of workers.
+def spawnSeeds(seed, taskCount):
+    return np.random.SeedSequence(seed).spawn(taskCount)
+
+
+### Pool
+
+# Shared inputs of a worker, set once per process by `initPoolWorker`
+workerSharedArgs = ()
+
+def initPoolWorker(sharedArgs):
+    global workerSharedArgs
+    workerSharedArgs = sharedArgs
+
+def callWithSharedArgs(function, *args):
+    return function(*workerSharedArgs, *args)
+
+
+# Results of `function(*sharedArgs, *taskArgs)` for the task arguments taken from `argLists`, one list per argument as
+# for `map`, in task order. The number of workers defaults to the number of CPUs and is at most the number of tasks.
+def mapOnPool(function, argLists, workerCount=None, sharedArgs=()):
+    argLists = [list(args) for args in argLists]
+    taskCount = min(len(args) for args in argLists) if len(argLists) > 0 else 0
+    if workerCount == None: workerCount = os.cpu_count() or 1
+    workerCount = min(workerCount, taskCount)
+    if workerCount <= 1:
+        return [function(*sharedArgs, *taskArgs) for taskArgs in zip(*argLists)]
+
+    with ProcessPoolExecutor(max_workers=workerCount, initializer=initPoolWorker, initargs=(sharedArgs,)) as executor:
+        return list(executor.map(partial(callWithSharedArgs, function), *argLists))
@@ -0,0 +1,155 @@
+from functools import lru_cache
+import numpy as np
+
+
+### Model
+
+# Delay model used for the robustness cost in the planner (see `DataActivityProcessor.GetConflictProbability`): mean
+# delay as a polynomial of the planned duration, and gamma distribution parameters alpha = m^2 / d and beta = m / d
+meanDelayCoefs = (1 / 5571, 0.123, 37.38)
+gammaDistributionDivisor = 3879
+
+
+# Model parameters from fitted delay distributions: the mean delay polynomial, and the variance of the overall gamma
+# fit as divisor, since alpha / beta^2 = m^2 / d / (m / d)^2 = d
+def estimateModelParameters(muCoef, gammaAlpha, gammaBeta):
+    return tuple(float(coef) for coef in muCoef), gammaAlpha / (gammaBeta * gammaBeta)
+
+
+def getMeanDelays(plannedDurations, meanDelayCoefs=meanDelayCoefs):
+    plannedDurations = np.asarray(plannedDurations, dtype=float)
+    return meanDelayCoefs[0] * plannedDurations * plannedDurations + meanDelayCoefs[1] * plannedDurations + meanDelayCoefs[2]
+
+
+def getGammaParameters(meanDelays, gammaDistributionDivisor=gammaDistributionDivisor):
+    alphas = meanDelays * meanDelays / gammaDistributionDivisor
+    betas = meanDelays / gammaDistributionDivisor
+    return alphas, betas
+
+
+# Probability that a delay of an activity is longer than the waiting time after it
+def getConflictProbsIfDelayed(plannedDurations, waitingTimes, meanDelayCoefs=meanDelayCoefs, gammaDistributionDivisor=gammaDistributionDivisor):
+    import scipy.stats as stats
+    alphas, betas = getGammaParameters(getMeanDelays(plannedDurations, meanDelayCoefs), gammaDistributionDivisor)
+    return 1 - stats.gamma.cdf(waitingTimes, alphas, 0, 1 / betas)
+
+
+# Evaluate the robustness cost model for arrays of inputs, which are broadcast against each other. If a lookup table
+# is given, the conflict probabilities are interpolated from it instead of computed exactly; the table must be built
+# for the same model parameters.
+def evaluateRobustnessCosts(plannedDurations, waitingTimes, delayProbs, conflictCosts, table=None, meanDelayCoefs=meanDelayCoefs, gammaDistributionDivisor=gammaDistributionDivisor):
+    meanDelays = getMeanDelays(plannedDurations, meanDelayCoefs)
+    alphas, betas = getGammaParameters(meanDelays, gammaDistributionDivisor)
+    if table != None and not table.hasModelParameters(meanDelayCoefs, gammaDistributionDivisor):
+        raise ValueError('Conflict probability table was built for other model parameters')
+    if table == None:
+        import scipy.stats as stats
+        conflictProbsIfDelayed = 1 - stats.gamma.cdf(waitingTimes, alphas, 0, 1 / betas)
+    else:
+        conflictProbsIfDelayed = table.getConflictProbsIfDelayed(plannedDurations, waitingTimes)
+    conflictProbs = np.asarray(delayProbs) * conflictProbsIfDelayed
+    return {
+        'meanDelays': meanDelays,
+        'alphas': alphas,
+        'betas': betas,
+        'conflictProbsIfDelayed': conflictProbsIfDelayed,
+        'conflictProbs': conflictProbs,
+        'robustnessCosts': conflictProbs * np.asarray(conflictCosts),
+    }
+
+
+def getRobustnessCosts(plannedDurations, waitingTimes, delayProbs, conflictCosts, table=None, meanDelayCoefs=meanDelayCoefs, gammaDistributionDivisor=gammaDistributionDivisor):
+    return evaluateRobustnessCosts(plannedDurations, waitingTimes, delayProbs, conflictCosts, table, meanDelayCoefs, gammaDistributionDivisor)['robustnessCosts']
+
+
+### Lookup table
+
+# Conflict probabilities on a rectilinear (planned duration, waiting time) grid with bilinear interpolation. The grid
+# starts coarse and intervals are halved until the interpolation error at all cell and edge midpoints is at most
+# `maxError`. Inputs outside the grid are computed exactly. This includes waiting times below `minWaitingTime`, since
+# for alpha < 1 the conflict probability is steepest near a waiting time of 0.
+class ConflictProbTable:
+    def __init__(self, maxDuration=720, maxWaitingTime=720, maxError=1e-4, minWaitingTime=1, maxRefineCount=32, meanDelayCoefs=meanDelayCoefs, gammaDistributionDivisor=gammaDistributionDivisor):
+        self.maxError = maxError
+        self.meanDelayCoefs = tuple(float(coef) for coef in meanDelayCoefs)
+        self.gammaDistributionDivisor = float(gammaDistributionDivisor)
+        self.durations = np.linspace(0, maxDuration, 9)
+        self.waitingTimes = np.linspace(minWaitingTime, maxWaitingTime, 9)
+
+        for _ in range(maxRefineCount):
+            self.values = self.getExactGrid(self.durations, self.waitingTimes)
+            isDurationRefined, isWaitingTimeRefined = self.getIntervalsToRefine()
+            if not isDurationRefined.any() and not isWaitingTimeRefined.any(): break
+            self.durations = refineAxis(self.durations, isDurationRefined)
+            self.waitingTimes = refineAxis(self.waitingTimes, isWaitingTimeRefined)
+        else:
+            raise ValueError('Could not reach a conflict probability table error of {0} in {1} refinements'.format(maxError, maxRefineCount))
+
+    def hasModelParameters(self, meanDelayCoefs, gammaDistributionDivisor):
+        return self.meanDelayCoefs == tuple(float(coef) for coef in meanDelayCoefs) and self.gammaDistributionDivisor == float(gammaDistributionDivisor)
+
+    def getExactConflictProbs(self, plannedDurations, waitingTimes):
+        return getConflictProbsIfDelayed(plannedDurations, waitingTimes, self.meanDelayCoefs, self.gammaDistributionDivisor)
+
+    def getExactGrid(self, durations, waitingTimes):
+        return self.getExactConflictProbs(durations[:, np.newaxis], waitingTimes[np.newaxis, :])
+
+    # Intervals of both axes where the interpolation at a midpoint exceeds the error bound
+    def getIntervalsToRefine(self):
+        midDurations = (self.durations[:-1] + self.durations[1:]) / 2
+        midWaitingTimes = (self.waitingTimes[:-1] + self.waitingTimes[1:]) / 2
+        durationEdgeErrors = np.abs(self.interpolate(midDurations[:, np.newaxis], self.waitingTimes[np.newaxis, :]) - self.getExactGrid(midDurations, self.waitingTimes))
+        waitingTimeEdgeErrors = np.abs(self.interpolate(self.durations[:, np.newaxis], midWaitingTimes[np.newaxis, :]) - self.getExactGrid(self.durations, midWaitingTimes))
+        centerErrors = np.abs(self.interpolate(midDurations[:, np.newaxis], midWaitingTimes[np.newaxis, :]) - self.getExactGrid(midDurations, midWaitingTimes))
+
+        isCenterRefined = centerErrors > self.maxError
+        isDurationRefined = (durationEdgeErrors > self.maxError).any(axis=1) | isCenterRefined.any(axis=1)
+        isWaitingTimeRefined = (waitingTimeEdgeErrors > self.maxError).any(axis=0) | isCenterRefined.any(axis=0)
+        return isDurationRefined, isWaitingTimeRefined
+
+    def interpolate(self, plannedDurations, waitingTimes):
+        plannedDurations, waitingTimes = np.broadcast_arrays(np.asarray(plannedDurations, dtype=float), np.asarray(waitingTimes, dtype=float))
+        durationIndices, durationWeights = getInterpolationWeights(self.durations, plannedDurations)
+        waitingTimeIndices, waitingTimeWeights = getInterpolationWeights(self.waitingTimes, waitingTimes)
+
+        values = self.values
+        lowerValues = values[durationIndices, waitingTimeIndices] * (1 - waitingTimeWeights) + values[durationIndices, waitingTimeIndices + 1] * waitingTimeWeights
+        upperValues = values[durationIndices + 1, waitingTimeIndices] * (1 - waitingTimeWeights) + values[durationIndices + 1, waitingTimeIndices + 1] * waitingTimeWeights
+        return lowerValues * (1 - durationWeights) + upperValues * durationWeights
+
+    def isInRange(self, plannedDurations, waitingTimes):
+        return (plannedDurations >= self.durations[0]) & (plannedDurations <= self.durations[-1]) & (waitingTimes >= self.waitingTimes[0]) & (waitingTimes <= self.waitingTimes[-1])
+
+    def getConflictProbsIfDelayed(self, plannedDurations, waitingTimes):
+        plannedDurations, waitingTimes = np.broadcast_arrays(np.asarray(plannedDurations, dtype=float), np.asarray(waitingTimes, dtype=float))
+        isInRange = self.isInRange(plannedDurations, waitingTimes)
+        conflictProbs = np.empty(plannedDurations.shape)
+        conflictProbs[isInRange] = self.interpolate(plannedDurations[isInRange], waitingTimes[isInRange])
+        conflictProbs[~isInRange] = self.getExactConflictProbs(plannedDurations[~isInRange], waitingTimes[~isInRange])
+        return conflictProbs
+
+    # Absolute difference between the table values and the exact scipy values
+    def getErrors(self, plannedDurations, waitingTimes):
+        return np.abs(self.getConflictProbsIfDelayed(plannedDurations, waitingTimes) - self.getExactConflictProbs(plannedDurations, waitingTimes))
+
+
+# Index of the grid interval containing each value, and the relative position of the value within it
+def getInterpolationWeights(axis, values):
+    indices = np.clip(np.searchsorted(axis, values, side='right') - 1, 0, len(axis) - 2)
+    weights = (values - axis[indices]) / (axis[indices + 1] - axis[indices])
+    return indices, weights
+
+
+# Split the selected intervals of an axis in half
+def refineAxis(axis, isRefined):
+    midpoints = (axis[:-1] + axis[1:]) / 2
+    return np.sort(np.concatenate((axis, midpoints[isRefined])))
+
+
+# Tables are cached per range, error bound and model parameters, since building one takes many exact evaluations
+def getConflictProbTable(maxDuration=720, maxWaitingTime=720, maxError=1e-4, minWaitingTime=1, meanDelayCoefs=meanDelayCoefs, gammaDistributionDivisor=gammaDistributionDivisor):
+    return getCachedConflictProbTable(maxDuration, maxWaitingTime, maxError, minWaitingTime, tuple(float(coef) for coef in meanDelayCoefs), float(gammaDistributionDivisor))
+
+@lru_cache(maxsize=None)
+def getCachedConflictProbTable(maxDuration, maxWaitingTime, maxError, minWaitingTime, meanDelayCoefs, gammaDistributionDivisor):
+    return ConflictProbTable(maxDuration, maxWaitingTime, maxError, minWaitingTime, meanDelayCoefs=meanDelayCoefs, gammaDistributionDivisor=gammaDistributionDivisor)
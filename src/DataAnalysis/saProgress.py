@@ -0,0 +1,107 @@
+import os
+import re
+import numpy as np
+
+
+# Simulated annealing progress is read from the summary.txt files that `AlgorithmMultithreadHandler` writes to each run
+# output folder. After the final Pareto front, these list the min cost and max satisfaction of the Pareto front at every
+# log, as a single line of comma-separated values with -1 for logs before the first solution.
+summaryFileName = 'summary.txt'
+progressionHeaders = {
+    'Min cost progression:': 'costProgress',
+    'Max satisfaction progression:': 'satisfactionProgress',
+}
+iterationCountPattern = re.compile(r'SA finished (\S+) iterations')
+largeNumSuffixes = {'k': 1e3, 'M': 1e6, 'B': 1e9}
+
+
+### Parsing
+
+# Parse a number written by `ToStringHelper.LargeNumToString`, like 10B
+def parseLargeNum(numStr):
+    if numStr[-1] in largeNumSuffixes: return int(round(float(numStr[:-1]) * largeNumSuffixes[numStr[-1]]))
+    return int(round(float(numStr)))
+
+
+# Read a line of comma-separated values in chunks of at most `chunkSize` characters, so that progressions of long
+# runs with a high log frequency are never held in memory as text
+def readProgression(file, chunkSize=1 << 20):
+    valueChunks = []
+    remainder = ''
+    while True:
+        text = remainder + file.readline(chunkSize)
+        isLineEnd = text.endswith('\n') or len(text) == len(remainder)
+        splitIndex = len(text) if isLineEnd else text.rfind(',') + 1
+        valuesText, remainder = text[:splitIndex].strip().rstrip(','), text[splitIndex:]
+        if valuesText != '': valueChunks.append(np.array(valuesText.split(','), dtype=float))
+        if isLineEnd: break
+    return np.concatenate(valueChunks) if len(valueChunks) > 0 else np.zeros(0)
+
+
+# Progressions and iteration count from a summary file, or from the summary file in a run output folder
+def parseProgressLog(filePath, chunkSize=1 << 20):
+    if os.path.isdir(filePath): filePath = os.path.join(filePath, summaryFileName)
+    progressLog = {'iterationCount': None}
+    with open(filePath) as file:
+        while True:
+            line = file.readline()
+            if line == '': break
+            line = line.strip()
+            if line in progressionHeaders:
+                progressLog[progressionHeaders[line]] = readProgression(file, chunkSize)
+                continue
+            iterationCountMatch = iterationCountPattern.match(line)
+            if iterationCountMatch != None: progressLog['iterationCount'] = parseLargeNum(iterationCountMatch.group(1))
+
+    for key in progressionHeaders.values():
+        if key not in progressLog: raise ValueError('No {0} found in {1}'.format(key, filePath))
+    return progressLog
+
+
+# Progressions of a run without the logs before the first solution, with the iteration number of each log. Logs are
+# spaced evenly over the iterations; `iterationCount` is used if the summary does not state it. Progressions are empty
+# for runs that ended before their first log or found no solution.
+def loadProgressRun(filePath, iterationCount=None):
+    progressLog = parseProgressLog(filePath)
+    if progressLog['iterationCount'] != None: iterationCount = progressLog['iterationCount']
+    if iterationCount == None: raise ValueError('Iteration count of {0} is unknown'.format(filePath))
+
+    costProgress = progressLog['costProgress']
+    logCount = len(costProgress)
+    logCountWithoutSolution = int(np.argmax(costProgress >= 0)) if np.any(costProgress >= 0) else logCount
+    logFrequency = iterationCount / logCount if logCount > 0 else 0
+    return {
+        'iterationCount': iterationCount,
+        'iterationNums': np.linspace(logFrequency * logCountWithoutSolution, iterationCount, logCount - logCountWithoutSolution),
+        'costProgress': costProgress[logCountWithoutSolution:],
+        'satisfactionProgress': progressLog['satisfactionProgress'][logCountWithoutSolution:],
+    }
+
+
+### Downsampling
+
+# Indices of the points to keep so that a line plot with `bucketCount` horizontal pixels looks the same: the first,
+# last, minimum and maximum point of each bucket of consecutive points. Series that are short enough are kept whole.
+def getMinMaxIndices(values, bucketCount):
+    pointCount = len(values)
+    if pointCount <= 4 * bucketCount: return np.arange(pointCount)
+
+    bucketStarts = np.linspace(0, pointCount, bucketCount + 1).astype(np.int64)[:-1]
+    bucketEnds = np.append(bucketStarts[1:], pointCount)
+    bucketLengths = bucketEnds - bucketStarts
+    minIndices = getFirstIndices(values == np.repeat(np.minimum.reduceat(values, bucketStarts), bucketLengths), bucketStarts)
+    maxIndices = getFirstIndices(values == np.repeat(np.maximum.reduceat(values, bucketStarts), bucketLengths), bucketStarts)
+    return np.unique(np.concatenate((bucketStarts, bucketEnds - 1, minIndices, maxIndices)))
+
+
+# First index at or after each bucket start where the mask is set, given that it is set at least once per bucket
+def getFirstIndices(mask, bucketStarts):
+    maskIndices = np.flatnonzero(mask)
+    return maskIndices[np.searchsorted(maskIndices, bucketStarts)]
+
+
+# Downsampled (iteration numbers, values) of a progression of a run
+def getProgressSeries(progressRun, seriesName, bucketCount):
+    values = progressRun[seriesName]
+    keptIndices = getMinMaxIndices(values, bucketCount)
+    return progressRun['iterationNums'][keptIndices], values[keptIndices]
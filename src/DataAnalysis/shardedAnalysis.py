@@ -0,0 +1,76 @@
+import fnmatch
+import glob
+import os
+import time
+from delayData import loadCachedDelayColumns, streamDelayColumns
+from delayStats import StreamingDelayStats
+from processPool import mapOnPool, spawnSeeds
+
+
+# Delay exports are analysed per shard (for example one export per planning week) into mergeable statistics, which
+# are then reduced into statistics of all shards together.
+
+
+### Shards
+
+# Delay exports are written as delays.json by `DebugDelaysExporter`; other JSON files in an output folder, like
+# runList.json or the info.json of a column cache, are not exports
+shardFilePattern = 'delays*.json'
+
+
+# Export files from a directory, a glob pattern or a list of either. Files given by name are always included, while
+# directories and patterns only match exports. Each export is included once, however often it is matched.
+def findShardPaths(shardPatterns):
+    if isinstance(shardPatterns, str): shardPatterns = [shardPatterns]
+    shardPaths = []
+    for shardPattern in shardPatterns:
+        if os.path.isfile(shardPattern):
+            shardPaths.append(shardPattern)
+            continue
+        if os.path.isdir(shardPattern): shardPattern = os.path.join(shardPattern, shardFilePattern)
+        shardPaths.extend(sorted(filePath for filePath in glob.glob(shardPattern, recursive=True) if fnmatch.fnmatch(os.path.basename(filePath), shardFilePattern)))
+    shardPaths = list(dict.fromkeys(os.path.realpath(filePath) for filePath in shardPaths))
+    if len(shardPaths) == 0: raise ValueError('No delay exports found for {0}'.format(', '.join(shardPatterns)))
+    return shardPaths
+
+
+# Map step: statistics of one export, read through the column cache or streamed batch by batch
+def analyzeShard(filePath, seed, useCache=True):
+    startTime = time.perf_counter()
+    delayStats = StreamingDelayStats(seed=seed)
+    if useCache:
+        columns = loadCachedDelayColumns(filePath)
+        readTime = time.perf_counter() - startTime
+        delayStats.add(columns)
+    else:
+        readTime = None
+        for columns in streamDelayColumns(filePath):
+            delayStats.add(columns)
+
+    shardInfo = {
+        'filePath': filePath,
+        'delayCount': delayStats.counts['allDelays'],
+        'readTime': readTime,
+        'totalTime': time.perf_counter() - startTime,
+    }
+    return delayStats, shardInfo
+
+
+# Analyze the shards on a process pool and merge their statistics in shard order
+def analyzeShards(shardPaths, workerCount=None, useCache=True, seed=0):
+    shardResults = mapOnPool(analyzeShard, [shardPaths, spawnSeeds(seed, len(shardPaths)), [useCache] * len(shardPaths)], workerCount)
+
+    # Reduce step
+    startTime = time.perf_counter()
+    delayStats = StreamingDelayStats(seed=seed)
+    for shardStats, _ in shardResults:
+        delayStats.merge(shardStats)
+    reduceTime = time.perf_counter() - startTime
+    return delayStats, [shardInfo for _, shardInfo in shardResults], reduceTime
+
+
+def printShardTimings(shardInfos, reduceTime):
+    for shardInfo in shardInfos:
+        readTime = '' if shardInfo['readTime'] == None else ', read %.3fs' % shardInfo['readTime']
+        print('Shard %s: %d delays in %.3fs%s' % (shardInfo['filePath'], shardInfo['delayCount'], shardInfo['totalTime'], readTime))
+    print('Reduced %d shards in %.3fs' % (len(shardInfos), reduceTime))
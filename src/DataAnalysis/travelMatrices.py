@@ -0,0 +1,141 @@
+import csv
+import os
+from functools import partial
+import numpy as np
+from cacheFolder import buildCacheFolder, hasCacheArrays, loadCacheArrays, readCacheInfo, saveCacheArrays
+
+
+# Travel info between locations is exported by TravelInfoExporter as long-format CSV tables with one row per pair of
+# location names. All tables are combined into one symmetric travel time and distance matrix over all location names,
+# with -1 for pairs that are not in any table. Station travel info is fully connected, while the internal and external
+# tables connect driver home addresses and companies to the stations.
+travelInfoFileNames = {
+    'station': 'stationTravelInfo.csv',
+    'internal': 'internalTravelInfo.csv',
+    'external': 'externalTravelInfo.csv',
+}
+fullyConnectedTables = ['station']
+missingValue = -1
+
+# Matrices are cached as .npy files in a folder in the intermediate folder, so they can be memory-mapped
+matrixKeys = ['travelTimes', 'travelDistances']
+cacheFolderName = 'travelMatrices.cache'
+
+
+### Reading
+
+def readTravelInfoCsv(filePath):
+    with open(filePath, newline='', encoding='utf-8-sig') as readFile:
+        rows = list(csv.DictReader(readFile))
+    return {
+        'location1Names': [row['location1Name'] for row in rows],
+        'location2Names': [row['location2Name'] for row in rows],
+        'travelTimes': np.array([int(row['travelTimeMinutes']) for row in rows], dtype=np.int32),
+        'travelDistances': np.array([int(row['travelDistanceKilometers']) for row in rows], dtype=np.int32),
+    }
+
+
+# Give every location name an integer ID in order of first occurrence, as TravelInfoImporter does per table
+def internNames(names, locationIds):
+    for name in names:
+        if name not in locationIds: locationIds[name] = len(locationIds)
+    return np.fromiter((locationIds[name] for name in names), dtype=np.int64, count=len(names))
+
+
+# Build the combined matrices and the location IDs of each table, to validate them against
+def buildTravelMatrices(intermediateFolder='./intermediate'):
+    locationIds = {}
+    tablePairs = {}
+    for tableName, fileName in travelInfoFileNames.items():
+        travelInfo = readTravelInfoCsv(os.path.join(intermediateFolder, fileName))
+        location1Ids = internNames(travelInfo['location1Names'], locationIds)
+        location2Ids = internNames(travelInfo['location2Names'], locationIds)
+        tablePairs[tableName] = (location1Ids, location2Ids, travelInfo)
+
+    locationCount = len(locationIds)
+    matrices = {matrixKey: np.full((locationCount, locationCount), missingValue, dtype=np.int32) for matrixKey in matrixKeys}
+    tableLocationIds = {}
+    for tableName, (location1Ids, location2Ids, travelInfo) in tablePairs.items():
+        for matrixKey in matrixKeys:
+            matrices[matrixKey][location1Ids, location2Ids] = travelInfo[matrixKey]
+            matrices[matrixKey][location2Ids, location1Ids] = travelInfo[matrixKey]
+        tableLocationIds[tableName] = (np.unique(location1Ids).tolist(), np.unique(location2Ids).tolist())
+    for matrixKey in matrixKeys:
+        np.fill_diagonal(matrices[matrixKey], 0)
+
+    return matrices, list(locationIds), tableLocationIds
+
+
+### Cache
+
+def getSourceInfo(intermediateFolder):
+    sourceInfo = {}
+    for fileName in travelInfoFileNames.values():
+        fileStat = os.stat(os.path.join(intermediateFolder, fileName))
+        sourceInfo[fileName] = {'size': fileStat.st_size, 'mtime': fileStat.st_mtime_ns}
+    return sourceInfo
+
+
+def writeMatrixCache(intermediateFolder, cacheFolder):
+    matrices, locationNames, tableLocationIds = buildTravelMatrices(intermediateFolder)
+    cacheInfo = {
+        'sources': getSourceInfo(intermediateFolder),
+        'locationNames': locationNames,
+        'tableLocationIds': tableLocationIds,
+    }
+    buildCacheFolder(cacheFolder, cacheInfo, partial(saveCacheArrays, matrices))
+
+
+# Travel matrices of the intermediate folder, rebuilding the cache when any of the tables changed
+def loadTravelMatrices(intermediateFolder='./intermediate'):
+    cacheFolder = os.path.join(intermediateFolder, cacheFolderName)
+    cacheInfo = readCacheInfo(cacheFolder)
+    isCacheValid = cacheInfo != None and cacheInfo['sources'] == getSourceInfo(intermediateFolder) and hasCacheArrays(cacheFolder, matrixKeys)
+    if not isCacheValid:
+        writeMatrixCache(intermediateFolder, cacheFolder)
+        cacheInfo = readCacheInfo(cacheFolder)
+
+    matrices = loadCacheArrays(cacheFolder, matrixKeys)
+    return TravelMatrices(matrices['travelTimes'], matrices['travelDistances'], cacheInfo['locationNames'], cacheInfo['tableLocationIds'])
+
+
+### Lookups
+
+class TravelMatrices:
+    def __init__(self, travelTimes, travelDistances, locationNames, tableLocationIds):
+        self.travelTimes = travelTimes
+        self.travelDistances = travelDistances
+        self.locationNames = locationNames
+        self.locationIds = {name: locationId for locationId, name in enumerate(locationNames)}
+        self.tableLocationIds = tableLocationIds
+
+    # IDs of an array of location names, or of location codes if their names are given; unknown locations get -1
+    def getLocationIds(self, names, locationNamesByCode=None):
+        if locationNamesByCode != None: names = [locationNamesByCode.get(code) for code in names]
+        return np.fromiter((self.locationIds.get(name, missingValue) for name in names), dtype=np.int64, count=len(names))
+
+    # Values of a matrix for arrays of (from, to) location IDs, with -1 where either location is unknown
+    def lookup(self, matrix, fromIds, toIds):
+        fromIds, toIds = np.broadcast_arrays(np.asarray(fromIds, dtype=np.int64), np.asarray(toIds, dtype=np.int64))
+        isKnown = (fromIds >= 0) & (toIds >= 0)
+        values = np.full(fromIds.shape, missingValue, dtype=np.int32)
+        values[isKnown] = matrix[fromIds[isKnown], toIds[isKnown]]
+        return values
+
+    def getTravelTimes(self, fromIds, toIds):
+        return self.lookup(self.travelTimes, fromIds, toIds)
+
+    def getTravelDistances(self, fromIds, toIds):
+        return self.lookup(self.travelDistances, fromIds, toIds)
+
+    # Location name pairs that a table should contain but are missing from the matrices: all pairs of different
+    # locations for fully connected tables, and all origin-destination pairs otherwise
+    def getMissingPairs(self, tableName):
+        location1Ids, location2Ids = self.tableLocationIds[tableName]
+        if tableName in fullyConnectedTables: location1Ids = location2Ids = sorted(set(location1Ids) | set(location2Ids))
+        location1Ids, location2Ids = np.array(location1Ids, dtype=np.int64), np.array(location2Ids, dtype=np.int64)
+
+        isMissing = np.asarray(self.travelTimes[np.ix_(location1Ids, location2Ids)]) == missingValue
+        if tableName in fullyConnectedTables: isMissing = np.triu(isMissing, 1)
+        missingIndices1, missingIndices2 = np.nonzero(isMissing)
+        return [(self.locationNames[location1Id], self.locationNames[location2Id]) for location1Id, location2Id in zip(location1Ids[missingIndices1], location2Ids[missingIndices2])]